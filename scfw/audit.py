@@ -8,7 +8,6 @@ import logging
 from scfw.loggers import FirewallLoggers
 import scfw.package_managers as package_managers
 from scfw.report import show_reports
-from scfw.verifier import FindingSeverity
 from scfw.verifiers import FirewallVerifiers
 
 _log = logging.getLogger(__name__)
@@ -41,7 +40,7 @@ def run_audit(args: Namespace) -> int:
         )
 
         output = show_reports(
-            [report.get_findings(severity) for severity in FindingSeverity],
+            list(report.get_findings_by_severity().values()),
             report.get_unverifiable(),
         )
         if output:
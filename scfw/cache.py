@@ -0,0 +1,111 @@
+"""
+Provides a persistent, expiring cache of per-package values for use in package verifiers.
+"""
+
+from collections.abc import Iterator
+import contextlib
+from pathlib import Path
+import sqlite3
+import time
+from typing import Callable, Generic, TypeVar
+
+from scfw.package import Package
+
+V = TypeVar("V", str, int, float)
+
+
+class PackageCache(Generic[V]):
+    """
+    A SQLite-backed cache mapping packages to values that expire after a time-to-live (TTL).
+
+    Values must be of a type SQLite can store natively.  Callers are responsible for encoding
+    richer values, such as sets of advisory IDs, before caching them.
+    """
+    def __init__(self, path: Path, table: str, ttl: int | Callable[[V], int]):
+        """
+        Initialize a new `PackageCache` backed by the given table of the database file at `path`.
+
+        Args:
+            path: A `Path` to the cache database file, which is created if it does not exist.
+            table: The name of the table in which to store cache entries, which is created if it does not exist.
+            ttl:
+                The time in seconds for which cache entries remain valid, or a function
+                computing this time from the value being cached.
+
+        Raises:
+            ValueError: The given table name is not a valid identifier.
+        """
+        if not table.isidentifier():
+            raise ValueError(f"Invalid cache table name '{table}'")
+
+        self._path: Path = path
+        self._table: str = table
+        self._ttl: int | Callable[[V], int] = ttl
+
+        with self._connect() as connection:
+            connection.execute(
+                f"CREATE TABLE IF NOT EXISTS {table} ("
+                "ecosystem TEXT, package TEXT, version TEXT, expires_at INTEGER, value, "
+                "PRIMARY KEY (ecosystem, package, version))"
+            )
+
+    def get(self, packages: list[Package]) -> dict[Package, V]:
+        """
+        Look up unexpired cached values for the given packages.
+
+        Args:
+            packages: The `list` of `Package` to look up.
+
+        Returns:
+            A `dict` mapping each package with an unexpired cache entry to its cached value.
+            Packages without such an entry are omitted.
+        """
+        now = int(time.time())
+        results = {}
+
+        with self._connect() as connection:
+            for package in packages:
+                row = connection.execute(
+                    f"SELECT value FROM {self._table} "
+                    "WHERE ecosystem = ? AND package = ? AND version = ? AND expires_at > ?",
+                    (str(package.ecosystem), package.name, package.version, now),
+                ).fetchone()
+                if row is not None:
+                    results[package] = row[0]
+
+        return results
+
+    def put(self, values: dict[Package, V]):
+        """
+        Cache the given values.
+
+        Args:
+            values: A `dict` mapping packages to the values to cache for them.
+        """
+        now = int(time.time())
+
+        def expires_at(value: V) -> int:
+            return now + (self._ttl if isinstance(self._ttl, int) else self._ttl(value))
+
+        with self._connect() as connection:
+            connection.executemany(
+                f"INSERT OR REPLACE INTO {self._table} VALUES (?, ?, ?, ?, ?)",
+                [
+                    (str(package.ecosystem), package.name, package.version, expires_at(value), value)
+                    for package, value in values.items()
+                ],
+            )
+
+    @contextlib.contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        """
+        Open a short-lived connection to the cache database that commits on success.
+
+        Connections are not shared so that the cache may be used from any thread.
+        """
+        connection = sqlite3.connect(self._path, timeout=5)
+        try:
+            with connection:
+                yield connection
+        finally:
+            connection.close()
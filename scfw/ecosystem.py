@@ -36,10 +36,8 @@ class ECOSYSTEM(Enum):
         Raises:
             ValueError: The given string does not refer to a valid `ECOSYSTEM`.
         """
-        mappings = {f"{ecosystem}".lower(): ecosystem for ecosystem in cls}
-
         try:
-            return mappings[s.lower()]
+            return _ECOSYSTEMS_BY_NAME[s.lower()]
         except KeyError:
             raise ValueError(f"Invalid package ecosystem: '{s}'")
 
@@ -62,3 +60,9 @@ class ECOSYSTEM(Enum):
                     "files.pythonhosted.org",
                     "pypi.org",
                 }
+
+
+_ECOSYSTEMS_BY_NAME = {f"{ecosystem}".lower(): ecosystem for ecosystem in ECOSYSTEM}
+"""
+Maps the lowercased printable name of each `ECOSYSTEM` to that `ECOSYSTEM`.
+"""
@@ -150,8 +150,9 @@ def _determine_firewall_action(
         from the environment or the command line, `run_firewall()` is required to
         interactively prompt the user to select an action.
     """
-    critical_findings = report.get_findings(FindingSeverity.CRITICAL)
-    warning_findings = report.get_findings(FindingSeverity.WARNING)
+    severity_findings = report.get_findings_by_severity()
+    critical_findings = severity_findings[FindingSeverity.CRITICAL]
+    warning_findings = severity_findings[FindingSeverity.WARNING]
 
     # Critical findings => BLOCK
     if critical_findings:
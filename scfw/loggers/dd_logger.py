@@ -18,7 +18,6 @@ from scfw.ecosystem import ECOSYSTEM
 from scfw.logger import FirewallAction, FirewallLogger, FirewallRunSummary
 from scfw.package import Package
 from scfw.report import FindingsReport, UnverifiablePackageReport, VerificationReport
-from scfw.verifier import FindingSeverity
 
 _log = logging.getLogger(__name__)
 
@@ -258,8 +257,8 @@ class DDLogger(FirewallLogger):
                 "audited_packages": _format_packages(report.packages()),
                 "findings": [
                     formatted
-                    for severity in FindingSeverity
-                    for formatted in _format_findings(report.get_findings(severity))
+                    for findings in report.get_findings_by_severity().values()
+                    for formatted in _format_findings(findings)
                 ],
                 "unverifiable": _format_unverifiable(report.get_unverifiable()),
             }
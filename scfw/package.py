@@ -32,8 +32,16 @@ class RemotePackageSource:
     remote_source: str
 
 
-@dataclass(eq=True, frozen=True)
-class Package:
+class _HashSlot:
+    """
+    Provides a slot for caching the hash of a `Package` that is not one of its dataclass fields.
+    """
+    __slots__ = ("_hash",)
+    _hash: int
+
+
+@dataclass(eq=True, frozen=True, slots=True)
+class Package(_HashSlot):
     """
     Specifies a software package in a supported ecosystem.
 
@@ -48,6 +56,28 @@ class Package:
     version: str
     source: Optional[LocalPackageSource | RemotePackageSource] = None
 
+    def __post_init__(self):
+        """
+        Compute the hash of a newly created `Package` once, as packages are used
+        extensively as keys in dictionaries and members of sets.
+        """
+        object.__setattr__(self, "_hash", hash((self.ecosystem, self.name, self.version, self.source)))
+
+    def __hash__(self) -> int:
+        """
+        Return the precomputed hash of a `Package`.
+
+        Returns:
+            An `int` hash consistent with `Package` equality.
+        """
+        return self._hash
+
+    def __reduce__(self):
+        """
+        Pickle a `Package` by its fields alone, as string hashes differ between processes.
+        """
+        return (self.__class__, (self.ecosystem, self.name, self.version, self.source))
+
     def __str__(self) -> str:
         """
         Represent a `Package` as a string using ecosystem-specific formatting.
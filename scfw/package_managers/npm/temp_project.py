@@ -6,6 +6,7 @@ import json
 import logging
 import os
 from pathlib import Path
+import re
 import shutil
 import subprocess
 from tempfile import TemporaryDirectory
@@ -22,6 +23,10 @@ _log = logging.getLogger(__name__)
 # Dependency sections present in npm package.json and package-lock.json files
 _DEPENDENCY_SECTIONS = {"dependencies", "devDependencies", "optionalDependencies", "peerDependencies"}
 
+# Matches the `silly` dry-run log lines reporting packages to be added or changed, capturing the target handle
+# All supported npm versions adhere to this format
+_TARGET_LOG_LINE = re.compile(r"^[^\S\n]*\S+[^\S\n]+sill(?:y)?[^\S\n]+(?:ADD|CHANGE)[^\S\n]+(\S+)", re.MULTILINE)
+
 
 class TemporaryNpmProject:
     """
@@ -229,19 +234,9 @@ class TemporaryNpmProject:
             KeyError: The `package-lock.json` file is malformed or missing data for installation targets.
             ValueError: The given `install_command` is empty or not a valid `npm` command.
         """
-        def extract_target_handles(dry_run_log: list[str], temp_dir_path: Path) -> list[str]:
-            target_handles = []
-
-            # All supported npm versions adhere to this format
-            for line in dry_run_log:
-                line_tokens = line.split()
-
-                if (
-                    len(line_tokens) >= 4
-                    and line_tokens[1] in {"sill", "silly"}
-                    and line_tokens[2] in {"ADD", "CHANGE"}
-                ):
-                    target_handles.append(line_tokens[3])
+        def extract_target_handles(dry_run_log: str, temp_dir_path: Path) -> list[str]:
+            # The log can be very long, so it is scanned as a whole rather than line by line
+            target_handles = _TARGET_LOG_LINE.findall(dry_run_log)
 
             lockfile_path = temp_dir_path / "package-lock.json"
             if not lockfile_path.is_file():
@@ -350,10 +345,8 @@ class TemporaryNpmProject:
             _log.info("Input npm install command results in error: nothing will be installed")
             return set()
 
-        dry_run_log = dry_run_process.stderr.strip().split('\n')
-
         # Each target handle corresponds to a (possibly duplicated) installation target
-        target_handles = extract_target_handles(dry_run_log, temp_dir_path)
+        target_handles = extract_target_handles(dry_run_process.stderr, temp_dir_path)
         if not target_handles:
             return set()
 
@@ -77,6 +77,25 @@ class VerificationReport:
 
         return severity_findings
 
+    def get_findings_by_severity(self) -> dict[FindingSeverity, FindingsReport]:
+        """
+        Return structured reports on packages that had findings, split by severity.
+
+        This is equivalent to calling `get_findings()` for each severity, but only
+        makes a single pass over the report.
+
+        Returns:
+            A `dict` mapping every `FindingSeverity` to a `FindingsReport` covering the
+            findings of that severity in the report, which may be empty.
+        """
+        severity_findings: dict[FindingSeverity, FindingsReport] = {severity: {} for severity in FindingSeverity}
+
+        for package, findings in self._findings.items():
+            for finding in findings:
+                severity_findings[finding.severity].setdefault(package, set()).add(finding)
+
+        return severity_findings
+
     def get_unverifiable(self) -> UnverifiablePackageReport:
         """
         Return a structured report on packages that were unable to be verified.
@@ -113,12 +132,8 @@ class VerificationReport:
             `package`: The `Package` the finding pertains to.
             `finding`: The `Finding` to be inserted for `package`.
         """
-        if package not in self._findings:
-            self._findings[package] = set()
-        self._findings[package].add(finding)
-
-        if package in self._clean:
-            self._clean.remove(package)
+        self._findings.setdefault(package, set()).add(finding)
+        self._clean.discard(package)
 
     def insert_unverifiable(self, package: Package, error_message: VerifierErrorMessage) -> None:
         """
@@ -128,12 +143,8 @@ class VerificationReport:
             `package`: The `Package` the unverified message pertains to.
             `error_message`: The `VerifierErrorMessage` to be inserted for `package`.
         """
-        if package not in self._unverifiable:
-            self._unverifiable[package] = set()
-        self._unverifiable[package].add(error_message)
-
-        if package in self._clean:
-            self._clean.remove(package)
+        self._unverifiable.setdefault(package, set()).add(error_message)
+        self._clean.discard(package)
 
     def packages(self) -> set[Package]:
         """
@@ -160,25 +171,11 @@ def show_reports(
         A pretty-printed `str` representation of the given reports suitable for displaying
         to the user during a run of Supply Chain Firewall.
     """
-    def show_line(linenum: int, line: str) -> str:
-        return (f"  - {line}" if linenum == 0 else f"    {line}")
-
-    def show_finding(finding: str) -> str:
-        return '\n'.join(
-            show_line(linenum, line) for linenum, line in enumerate(finding.split('\n'))
-        )
-
-    def show_output(package: Package, findings: list[str]) -> str:
-        return f"Package {package}:\n" + '\n'.join(map(show_finding, findings))
-
     # Combine the given `FindingsReport` into a single one
     combined_findings_report: FindingsReport = {}
     for findings_report in findings_reports:
         for package, findings in findings_report.items():
-            if package not in combined_findings_report:
-                combined_findings_report[package] = set(findings)
-            else:
-                combined_findings_report[package] |= findings
+            combined_findings_report.setdefault(package, set()).update(findings)
 
     # Sort the findings for each package based on severity
     sorted_findings = {
@@ -188,17 +185,17 @@ def show_reports(
 
     all_packages = set(sorted_findings) | set(unverifiable_report)
 
-    # Prepare the findings + unverifiable output for each package
-    combined_output = {}
-    for package in all_packages:
-        findings_output = list(map(lambda f: f.finding, sorted_findings.get(package, [])))
-        unverifiable_output = list(
-            map(lambda u: u.error_message, unverifiable_report.get(package, set()))
-        )
-        combined_output[package] = findings_output + unverifiable_output
-
-    # Print the output to string, alphabetized by package name
-    return '\n'.join(
-        show_output(package, combined_output[package])
-        for package in sorted(all_packages, key=str)
-    )
+    # Print the output for each package to a single list of lines, alphabetized by package name
+    lines: list[str] = []
+    for package in sorted(all_packages, key=str):
+        lines.append(f"Package {package}:")
+
+        outputs = [finding.finding for finding in sorted_findings.get(package, [])]
+        outputs.extend(error_message.error_message for error_message in unverifiable_report.get(package, set()))
+
+        for output in outputs:
+            first_line, *other_lines = output.split('\n')
+            lines.append(f"  - {first_line}")
+            lines.extend(f"    {line}" for line in other_lines)
+
+    return '\n'.join(lines)
@@ -69,14 +69,18 @@ class FindingSeverity(Enum):
         Raises:
             ValueError: The given string does not refer to a valid `FindingSeverity`.
         """
-        mappings = {f"{severity}".lower(): severity for severity in cls}
-
         try:
-            return mappings[s.lower()]
+            return _FINDING_SEVERITIES_BY_NAME[s.lower()]
         except KeyError:
             raise ValueError(f"Invalid finding severity: '{s}'")
 
 
+_FINDING_SEVERITIES_BY_NAME = {f"{severity}".lower(): severity for severity in FindingSeverity}
+"""
+Maps the lowercased printable name of each `FindingSeverity` to that `FindingSeverity`.
+"""
+
+
 @dataclass(eq=True, frozen=True)
 class Finding:
     """
@@ -87,6 +91,23 @@ class Finding:
     finding: str
 
 
+class UnverifiablePackage(Exception):
+    """
+    An exception that occurs when a verifier is unable to verify a given package.
+    This is to be distinguished from a verification failure, i.e., when errors occur
+    in the course of verifying a package.
+
+    The canonical use-case for this exception occurs when a package is not within the
+    purview of a verifier's backing data source. For instance, a package sourced from
+    a private package registry would not be within the purview of a verifier that only
+    covers packages sourced from an ecosystem's main public registry.
+
+    Supply Chain Firewall handles this exception gracefully by separately collecting,
+    logging and reporting any packages that were unable to be verified.
+    """
+    pass
+
+
 class PackageVerifier(metaclass=ABCMeta):
     """
     Abstract base class for package verifiers.
@@ -134,19 +155,27 @@ class PackageVerifier(metaclass=ABCMeta):
         """
         pass
 
+    def verify_batch(self, packages: list[Package]) -> dict[Package, set[Finding] | UnverifiablePackage]:
+        """
+        Verify the given packages in bulk.
 
-class UnverifiablePackage(Exception):
-    """
-    An exception that occurs when a verifier is unable to verify a given package.
-    This is to be distinguished from a verification failure, i.e., when errors occur
-    in the course of verifying a package.
+        The default implementation verifies each package individually via `verify()`.
+        Verifiers backed by data sources that support bulk queries may override it
+        to verify many packages in fewer round-trips.
 
-    The canonical use-case for this exception occurs when a package is not within the
-    purview of a verifier's backing data source. For instance, a package sourced from
-    a private package registry would not be within the purview of a verifier that only
-    covers packages sourced from an ecosystem's main public registry.
+        Args:
+            packages: The `list` of `Package` to verify.
 
-    Supply Chain Firewall handles this exception gracefully by separately collecting,
-    logging and reporting any packages that were unable to be verified.
-    """
-    pass
+        Returns:
+            A `dict` mapping each given `Package` either to the `set[Finding]` reported
+            for it, as in `verify()`, or to the `UnverifiablePackage` exception raised
+            in attempting to verify it.
+        """
+        results: dict[Package, set[Finding] | UnverifiablePackage] = {}
+        for package in packages:
+            try:
+                results[package] = self.verify(package)
+            except UnverifiablePackage as e:
+                results[package] = e
+
+        return results
@@ -30,10 +30,22 @@ import pkgutil
 from scfw.ecosystem import ECOSYSTEM
 from scfw.package import Package
 from scfw.report import VerificationReport, VerifierErrorMessage
-from scfw.verifier import UnverifiablePackage
+from scfw.verifier import Finding, PackageVerifier, UnverifiablePackage
 
 _log = logging.getLogger(__name__)
 
+_executor = cf.ThreadPoolExecutor(
+    max_workers=min(64, 4 * (os.cpu_count() or 1)),
+    thread_name_prefix="scfw-verify",
+)
+"""
+The thread pool on which verification tasks are run, reused across calls to
+`FirewallVerifiers.verify_packages()`.
+
+Verification tasks are dominated by network I/O, so the pool is sized well beyond the
+number of CPUs.  Its worker threads are only started as tasks are submitted.
+"""
+
 
 class FirewallVerifiers:
     """
@@ -81,31 +93,58 @@ class FirewallVerifiers:
         """
         report = VerificationReport()
 
-        with cf.ThreadPoolExecutor() as executor:
-            task_results = {
-                executor.submit(lambda v, t: v.verify(t), verifier, package): (verifier.name(), package)
-                for verifier, package in itertools.product(self._verifiers, packages)
-            }
-            for future in cf.as_completed(task_results):
-                verifier, package = task_results[future]
-                try:
-                    if (findings := future.result()):
-                        _log.info(f"Verifier {verifier} had findings for package {package}")
-                        for finding in findings:
-                            report.insert_finding(package, finding)
-                    else:
-                        _log.info(f"Verifier {verifier} had no findings for package {package}")
-                        report.insert_clean(package)
-
-                except UnverifiablePackage as e:
-                    _log.info(f"Verifier {verifier} was unable to verify package {package}")
-                    report.insert_unverifiable(
-                        package,
-                        VerifierErrorMessage(
-                            verifier,
-                            f"Verifier {verifier} was unable to verify package {package}: {e}",
-                        ),
-                    )
+        # Per-package log messages are formatted lazily, as INFO logging is usually disabled
+        def insert_result(verifier: str, package: Package, result: set[Finding] | UnverifiablePackage):
+            if isinstance(result, UnverifiablePackage):
+                _log.info("Verifier %s was unable to verify package %s", verifier, package)
+                report.insert_unverifiable(
+                    package,
+                    VerifierErrorMessage(
+                        verifier,
+                        f"Verifier {verifier} was unable to verify package {package}: {result}",
+                    ),
+                )
+            elif result:
+                _log.info("Verifier %s had findings for package %s", verifier, package)
+                for finding in result:
+                    report.insert_finding(package, finding)
+            else:
+                _log.info("Verifier %s had no findings for package %s", verifier, package)
+                report.insert_clean(package)
+
+        # Verifiers that support bulk verification receive all packages in a single task
+        batch_verifiers = [verifier for verifier in self._verifiers if _supports_batch(verifier)]
+        batch_results = {
+            _executor.submit(verifier.verify_batch, list(packages)): verifier.name()
+            for verifier in batch_verifiers
+        }
+        task_results = {
+            _executor.submit(verifier.verify, package): (verifier.name(), package)
+            for verifier, package in itertools.product(
+                [verifier for verifier in self._verifiers if verifier not in batch_verifiers],
+                packages,
+            )
+        }
+
+        for future in cf.as_completed([*batch_results, *task_results]):
+            if future in batch_results:
+                verifier = batch_results[future]
+                for package, result in future.result().items():
+                    insert_result(verifier, package, result)
+                continue
+
+            verifier, package = task_results[future]
+            try:
+                insert_result(verifier, package, future.result())
+            except UnverifiablePackage as e:
+                insert_result(verifier, package, e)
 
         _log.info("Verification of packages complete")
         return report
+
+
+def _supports_batch(verifier: PackageVerifier) -> bool:
+    """
+    Determine whether the given verifier overrides the default `verify_batch()` implementation.
+    """
+    return type(verifier).verify_batch is not PackageVerifier.verify_batch
@@ -3,10 +3,15 @@ Defines a package verifier for warning on packages that were published too recen
 a user-configurable minimum age.
 """
 
-from datetime import datetime, timedelta, timezone
+import concurrent.futures as cf
+from datetime import timedelta
 import logging
 import os
+from pathlib import Path
+import time
 
+from scfw.cache import PackageCache
+from scfw.constants import SCFW_HOME_VAR
 from scfw.ecosystem import ECOSYSTEM
 from scfw.package import Package
 from scfw.verifier import Finding, FindingSeverity, PackageVerifier, UnverifiablePackage
@@ -27,6 +32,31 @@ minimum age, expressed as a positive integer representing the number of hours be
 which a warning is warranted.
 """
 
+AGE_VERIFIER_HOME = Path("age_verifier/")
+"""
+The `PackageAgeVerifier` home directory, relative to `SCFW_HOME`.
+"""
+
+AGE_CACHE_DEFAULT = AGE_VERIFIER_HOME / "cache.db"
+"""
+The filepath where `PackageAgeVerifier` caches package publication times, relative to `SCFW_HOME`.
+"""
+
+AGE_CACHE_TTL = 24 * 60 * 60
+"""
+The time in seconds for which `PackageAgeVerifier` caches a package's publication time.
+
+A package's publication time does not change once it is published, so entries are only
+expired to bound the size of the cache and to eventually notice packages that have been
+removed from their registry.
+"""
+
+_MAX_CONCURRENT_LOOKUPS = 32
+"""
+The maximum number of registry lookups `PackageAgeVerifier` performs concurrently when
+verifying packages in bulk.
+"""
+
 
 class PackageAgeVerifier(PackageVerifier):
     """
@@ -38,20 +68,16 @@ class PackageAgeVerifier(PackageVerifier):
         """
         Initialize a new `PackageAgeVerifier`.
         """
-        minimum_age = MINIMUM_AGE_DEFAULT
+        self.minimum_age = _resolve_minimum_age()
 
-        if (m := os.getenv(MINIMUM_AGE_VAR)):
+        self._cache = None
+        if (home_dir := os.getenv(SCFW_HOME_VAR)):
             try:
-                user_minimum_age = int(m)
-                if user_minimum_age < 0:
-                    raise ValueError("Minimum age cannot be negative")
-                minimum_age = user_minimum_age
-            except Exception:
-                _log.warning(
-                    f"Invalid minimum package age '{m}', using default value of {MINIMUM_AGE_DEFAULT} hours"
-                )
-
-        self.minimum_age = timedelta(hours=minimum_age)
+                cache_file = Path(home_dir) / AGE_CACHE_DEFAULT
+                cache_file.parent.mkdir(parents=True, exist_ok=True)
+                self._cache = PackageCache[float](cache_file, "release_times", AGE_CACHE_TTL)
+            except Exception as e:
+                _log.warning(f"Failed to set up cache for package age verifier: {e}")
 
     @classmethod
     def name(cls) -> str:
@@ -85,6 +111,100 @@ class PackageAgeVerifier(PackageVerifier):
             A `set[Finding]` containing a single `WARNING` finding if `package` is deemed
             to have been published too recently, otherwise an empty set.
 
+        Raises:
+            UnverifiablePackage:
+                The given package is from an unsupported ecosystem or has a known artifact
+                source other than the ecosystem's main registry.
+        """
+        result = self.verify_batch([package])[package]
+        if isinstance(result, UnverifiablePackage):
+            raise result
+
+        return result
+
+    def verify_batch(self, packages: list[Package]) -> dict[Package, set[Finding] | UnverifiablePackage]:
+        """
+        Verify the ages of the given packages in bulk.
+
+        Packages are grouped by name so that each package's registry metadata is
+        fetched once, and the groups are verified concurrently.
+
+        Args:
+            packages: The `list` of `Package` to verify.
+
+        Returns:
+            A `dict` mapping each given `Package` either to the `set[Finding]` reported
+            for it, as in `verify()`, or to the `UnverifiablePackage` exception raised
+            in attempting to verify it.
+        """
+        results: dict[Package, set[Finding] | UnverifiablePackage] = {}
+        verifiable = []
+
+        for package in packages:
+            try:
+                self._check_verifiable(package)
+                verifiable.append(package)
+            except UnverifiablePackage as e:
+                results[package] = e
+
+        if self.minimum_age == timedelta(0):
+            results.update((package, set()) for package in verifiable)
+            return results
+
+        # Publication times are handled as seconds since the epoch for cheap comparison
+        release_timestamps: dict[Package, float] = {}
+        if self._cache and verifiable:
+            try:
+                release_timestamps = self._cache.get(verifiable)
+            except Exception as e:
+                _log.warning(f"Failed to read package publication times from cache: {e}")
+
+        packages_by_name: dict[tuple[ECOSYSTEM, str], list[Package]] = {}
+        for package in verifiable:
+            if package not in release_timestamps:
+                packages_by_name.setdefault((package.ecosystem, package.name), []).append(package)
+
+        if packages_by_name:
+            fetched_timestamps: dict[Package, float] = {}
+            with cf.ThreadPoolExecutor(max_workers=min(len(packages_by_name), _MAX_CONCURRENT_LOOKUPS)) as executor:
+                for group_timestamps in executor.map(_get_release_timestamps, packages_by_name.values()):
+                    fetched_timestamps.update(group_timestamps)
+
+            if self._cache and fetched_timestamps:
+                try:
+                    self._cache.put(fetched_timestamps)
+                except Exception as e:
+                    _log.warning(f"Failed to write package publication times to cache: {e}")
+
+            release_timestamps.update(fetched_timestamps)
+
+        # Packages published after this time are too recent
+        cutoff = time.time() - self.minimum_age.total_seconds()
+        minimum_age_hours = int(self.minimum_age.total_seconds()) // 3600
+
+        for package in verifiable:
+            release_timestamp = release_timestamps.get(package)
+            if release_timestamp is None or release_timestamp <= cutoff:
+                results[package] = set()
+                continue
+
+            results[package] = {
+                Finding(
+                    self.name(),
+                    FindingSeverity.WARNING,
+                    (
+                        f"Package {package} was published less than {minimum_age_hours} hours ago"
+                        ": treat new releases with caution"
+                    ),
+                )
+            }
+
+        return results
+
+    def _check_verifiable(self, package: Package):
+        """
+        Check that the given package is within the purview of `PackageAgeVerifier`.
+
         Raises:
             UnverifiablePackage:
                 The given package is from an unsupported ecosystem or has a known artifact
@@ -100,9 +220,17 @@ class PackageAgeVerifier(PackageVerifier):
                 f"{self.name()}: Unknown source for package {package}: assuming {package.ecosystem} registry source"
             )
 
-        if self.minimum_age == timedelta(0):
-            return set()
 
+def _get_release_timestamps(packages: list[Package]) -> dict[Package, float]:
+    """
+    Look up the publication times of the given packages in their registries, in seconds
+    since the epoch.
+
+    Packages whose publication time could not be determined are omitted.
+    """
+    release_timestamps = {}
+
+    for package in packages:
         try:
             match package.ecosystem:
                 case ECOSYSTEM.Npm:
@@ -110,23 +238,31 @@ class PackageAgeVerifier(PackageVerifier):
                 case ECOSYSTEM.PyPI:
                     release_datetime_utc = pypi.get_release_datetime_utc(package.name, package.version)
 
-            if datetime.now(tz=timezone.utc) - release_datetime_utc < self.minimum_age:
-                minimum_age_hours = int(self.minimum_age.total_seconds()) // 3600
-                return {
-                    Finding(
-                        self.name(),
-                        FindingSeverity.WARNING,
-                        (
-                            f"Package {package} was published less than {minimum_age_hours} hours ago"
-                            ": treat new releases with caution"
-                        ),
-                    )
-                }
-
+            release_timestamps[package] = release_datetime_utc.timestamp()
         except Exception as e:
             _log.warning(f"Failed to determine publication datetime for package {package}: {e}")
 
-        return set()
+    return release_timestamps
+
+
+def _resolve_minimum_age() -> timedelta:
+    """
+    Resolve the minimum package age from the environment.
+    """
+    minimum_age = MINIMUM_AGE_DEFAULT
+
+    if (m := os.getenv(MINIMUM_AGE_VAR)):
+        try:
+            user_minimum_age = int(m)
+            if user_minimum_age < 0:
+                raise ValueError("Minimum age cannot be negative")
+            minimum_age = user_minimum_age
+        except Exception:
+            _log.warning(
+                f"Invalid minimum package age '{m}', using default value of {MINIMUM_AGE_DEFAULT} hours"
+            )
+
+    return timedelta(hours=minimum_age)
 
 
 def load_verifier() -> PackageVerifier:
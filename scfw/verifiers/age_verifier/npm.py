@@ -3,9 +3,36 @@ Provides utilities for querying the npm registry to discover package publication
 """
 
 from datetime import datetime
-from dateutil import parser as datetime_parser
+import functools
 
+from dateutil import parser as datetime_parser
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    import orjson  # type: ignore
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+
+import scfw
+
+# A shared session allows connections to registry.npmjs.org to be reused across concurrent lookups
+_session = requests.Session()
+_session.headers.update({"User-Agent": f"scfw/{scfw.__version__}"})
+_session.mount(
+    "https://",
+    HTTPAdapter(
+        pool_connections=1,
+        pool_maxsize=32,
+        max_retries=Retry(total=2, backoff_factor=0.1, status_forcelist=[429, 502, 503, 504]),
+    ),
+)
+
+_TIMEOUT = (2, 5)
+"""
+The connect and read timeouts, in seconds, for registry requests.
+"""
 
 
 def get_release_datetime_utc(package_name: str, package_version: str) -> datetime:
@@ -21,16 +48,28 @@ def get_release_datetime_utc(package_name: str, package_version: str) -> datetim
 
     Raises:
         requests.HTTPError: Failed to query the npm registry.
-        requests.exceptions.JSONDecodeError: Failed to parse query response as JSON.
+        ValueError: Failed to parse query response as JSON.
         RuntimeError: Package metadata missing required fields.
         dateutil.ParserError: Failed to parse publication datetime.
     """
-    r = requests.get(f"https://registry.npmjs.org/{package_name}")
-    r.raise_for_status()
-
-    package_metadata = r.json()
-    release_timestamp = package_metadata.get("time", {}).get(package_version)
+    release_timestamp = _get_release_timestamps(package_name).get(package_version)
     if not release_timestamp:
         raise RuntimeError(f"Metadata for npm package {package_name} missing required fields")
 
     return datetime_parser.parse(release_timestamp)
+
+
+@functools.lru_cache(maxsize=4096)
+def _get_release_timestamps(package_name: str) -> dict[str, str]:
+    """
+    Fetch the publication timestamps of all versions of a given npm package.
+
+    Results are memoized so that verifying several versions of the same package
+    costs a single request.  Failed requests raise and are therefore not cached.
+    """
+    r = _session.get(f"https://registry.npmjs.org/{package_name}", timeout=_TIMEOUT)
+    r.raise_for_status()
+
+    package_metadata = orjson.loads(r.content) if orjson else r.json()
+
+    return package_metadata.get("time", {})
@@ -3,9 +3,36 @@ Provides utilities for querying the PyPI registry to discover package publicatio
 """
 
 from datetime import datetime
-from dateutil import parser as datetime_parser
+import functools
 
+from dateutil import parser as datetime_parser
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    import orjson  # type: ignore
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+
+import scfw
+
+# A shared session allows connections to pypi.org to be reused across concurrent lookups
+_session = requests.Session()
+_session.headers.update({"User-Agent": f"scfw/{scfw.__version__}"})
+_session.mount(
+    "https://",
+    HTTPAdapter(
+        pool_connections=1,
+        pool_maxsize=32,
+        max_retries=Retry(total=2, backoff_factor=0.1, status_forcelist=[429, 502, 503, 504]),
+    ),
+)
+
+_TIMEOUT = (2, 5)
+"""
+The connect and read timeouts, in seconds, for registry requests.
+"""
 
 
 def get_release_datetime_utc(package_name: str, package_version) -> datetime:
@@ -21,26 +48,42 @@ def get_release_datetime_utc(package_name: str, package_version) -> datetime:
 
     Raises:
         requests.HTTPError: Failed to query the PyPI registry.
-        requests.exceptions.JSONDecodeError: Failed to parse query response as JSON.
+        ValueError: Failed to parse query response as JSON.
         RuntimeError:
             * Package metadata missing required fields.
             * No publication timestamps found for specified release.
         dateutil.ParserError: Failed to parse publication datetime.
     """
-    r = requests.get(f"https://pypi.org/pypi/{package_name}/json")
-    r.raise_for_status()
-
-    package_metadata = r.json()
-    release_metadata = package_metadata.get("releases", {}).get(package_version)
-    if not release_metadata:
+    release_timestamps = _get_release_timestamps(package_name).get(package_version)
+    if release_timestamps is None:
         raise RuntimeError("Package metadata missing required fields")
 
-    release_datetimes = set()
-    for metadata in release_metadata:
-        if (release_datetime := metadata.get("upload_time_iso_8601")):
-            release_datetimes.add(datetime_parser.parse(release_datetime))
-
+    release_datetimes = {datetime_parser.parse(timestamp) for timestamp in release_timestamps}
     if not release_datetimes:
         raise RuntimeError(f"No publication timestamp for version {package_version} of package {package_name}")
 
-    return sorted(release_datetimes)[-1]
+    return max(release_datetimes)
+
+
+@functools.lru_cache(maxsize=4096)
+def _get_release_timestamps(package_name: str) -> dict[str, tuple[str, ...]]:
+    """
+    Fetch the upload timestamps of the files of all releases of a given PyPI package.
+
+    Only the timestamps are retained from the (often large) package metadata.  Results
+    are memoized so that verifying several versions of the same package costs a single
+    request.  Failed requests raise and are therefore not cached.
+    """
+    r = _session.get(f"https://pypi.org/pypi/{package_name}/json", timeout=_TIMEOUT)
+    r.raise_for_status()
+
+    package_metadata = orjson.loads(r.content) if orjson else r.json()
+
+    return {
+        version: tuple(
+            release_timestamp for metadata in release_metadata
+            if (release_timestamp := metadata.get("upload_time_iso_8601"))
+        )
+        for version, release_metadata in package_metadata.get("releases", {}).items()
+        if release_metadata
+    }
@@ -2,9 +2,11 @@
 Defines a package verifier for Datadog Security Research's malicious packages dataset.
 """
 
+import concurrent.futures as cf
 import logging
 import os
 from pathlib import Path
+import sys
 
 from scfw.constants import SCFW_HOME_VAR
 from scfw.ecosystem import ECOSYSTEM
@@ -42,11 +44,21 @@ class DatadogMaliciousPackagesVerifier(PackageVerifier):
                     f"Failed to set up cache directory for Datadog malicious packages verifier: {e}"
                 )
 
-        for ecosystem in self.supported_ecosystems():
+        def get_manifest(ecosystem: ECOSYSTEM) -> dict[str, frozenset[str]]:
             if cache_dir:
-                self._manifests[ecosystem] = dataset.get_latest_manifest(cache_dir, ecosystem)
+                manifest = dataset.get_latest_manifest(cache_dir, ecosystem)
             else:
-                self._manifests[ecosystem] = dataset.download_manifest(ecosystem)
+                manifest = dataset.download_manifest(ecosystem)
+
+            # Frozensets make for compact, constant-time version lookups
+            return {sys.intern(name): frozenset(versions) for name, versions in manifest.items()}
+
+        # Obtain the manifests concurrently so that their network round-trips overlap
+        ecosystems = self.supported_ecosystems()
+        with cf.ThreadPoolExecutor(max_workers=len(ecosystems)) as executor:
+            manifest_futures = {ecosystem: executor.submit(get_manifest, ecosystem) for ecosystem in ecosystems}
+            for ecosystem, future in manifest_futures.items():
+                self._manifests[ecosystem] = future.result()
 
     @classmethod
     def name(cls) -> str:
@@ -2,7 +2,6 @@
 Utilities for downloading and caching the malicious package dataset manifests.
 """
 
-import glob
 import json
 import logging
 import os
@@ -11,13 +10,40 @@ import re
 from typing import Optional, TypeAlias
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
+try:
+    import orjson  # type: ignore
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+
+import scfw
 from scfw.ecosystem import ECOSYSTEM
 
 _log = logging.getLogger(__name__)
 
 _DD_DATASET_SAMPLES_URL = "https://raw.githubusercontent.com/DataDog/malicious-software-packages-dataset/main/samples"
 
+# A shared session allows connections to GitHub to be reused across manifest downloads
+# The manifests are large and highly compressible, so always ask for them gzip-encoded
+_session = requests.Session()
+_session.headers.update({"User-Agent": f"scfw/{scfw.__version__}", "Accept-Encoding": "gzip"})
+_session.mount(
+    "https://",
+    HTTPAdapter(
+        pool_connections=4,
+        pool_maxsize=16,
+        max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=[429, 502, 503, 504]),
+    ),
+)
+
+_ETAG_HEADER_PATTERN = re.compile('W/"(.*)"')
+
+_ETAG_FILE_NAME_PATTERNS = {
+    ecosystem: re.compile(rf"{re.escape(str(ecosystem))}(.*)\.json") for ecosystem in ECOSYSTEM
+}
+
 Manifest: TypeAlias = dict[str, list[str]]
 """
 A malicious packages dataset manifest mapping package names to affected versions.
@@ -55,17 +81,30 @@ def get_latest_manifest(cache_dir: Path, ecosystem: ECOSYSTEM) -> Manifest:
         The latest dataset `Manifest` for the given `ECOSYSTEM`.
     """
     def get_cached_manifest_file() -> Optional[Path]:
-        manifest_files = glob.glob(str(cache_dir / f"{ecosystem}*.json"))
-        return Path(manifest_files[0]) if manifest_files else None
+        prefix = str(ecosystem)
+        with os.scandir(cache_dir) as entries:
+            for entry in entries:
+                if entry.name.startswith(prefix) and entry.name.endswith(".json"):
+                    return Path(entry.path)
+        return None
 
     def extract_etag_file_name(file_name: str) -> Optional[str]:
-        match = re.search(f"{ecosystem}(.*).json", file_name)
+        match = _ETAG_FILE_NAME_PATTERNS[ecosystem].search(file_name)
         return match.group(1) if match else None
 
-    def write_cached_manifest(etag: Optional[str], manifest: Manifest):
+    def write_cached_manifest(etag: Optional[str], manifest: Manifest) -> Path:
         manifest_file = cache_dir / f"{ecosystem}{etag if etag else ''}.json"
-        with open(manifest_file, 'w') as f:
-            json.dump(manifest, f)
+
+        # Write to a temporary file and move it into place so that an interrupted
+        # write never leaves a truncated manifest in the cache
+        temp_file = manifest_file.with_suffix(".json.tmp")
+        with open(temp_file, 'wb') as f:
+            f.write(_dump_manifest(manifest))
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temp_file, manifest_file)
+
+        return manifest_file
 
     latest_etag, latest_manifest = None, None
 
@@ -83,8 +122,7 @@ def get_latest_manifest(cache_dir: Path, ecosystem: ECOSYSTEM) -> Manifest:
         # Note: `cached_manifest_file` is implied by `last_etag` but Pylance can't keep up
         if not latest_manifest and cached_manifest_file:
             try:
-                with open(cached_manifest_file) as f:
-                    latest_manifest = json.load(f)
+                latest_manifest = _load_manifest(cached_manifest_file.read_bytes())
             except Exception as e:
                 _log.warning(f"Failed to read {ecosystem} dataset from cache: {e}")
 
@@ -95,9 +133,9 @@ def get_latest_manifest(cache_dir: Path, ecosystem: ECOSYSTEM) -> Manifest:
     # Update the cache if we downloaded from the remote dataset
     if not last_etag or (latest_etag and latest_etag != last_etag):
         try:
-            if cached_manifest_file:
+            manifest_file = write_cached_manifest(latest_etag, latest_manifest)
+            if cached_manifest_file and cached_manifest_file != manifest_file:
                 os.remove(cached_manifest_file)
-            write_cached_manifest(latest_etag, latest_manifest)
         except Exception as e:
             _log.warning(f"Failed to updated cached {ecosystem} dataset: {e}")
 
@@ -108,30 +146,67 @@ def _download_manifest_etagged(ecosystem: ECOSYSTEM) -> tuple[Optional[str], Man
     """
     Download the dataset manifest for the given `ecosystem` and return it along with its ETag.
     """
-    request = requests.get(_manifest_url(ecosystem), timeout=5)
-    request.raise_for_status()
+    etag, manifest = _request_manifest(ecosystem)
+    if manifest is None:
+        raise RuntimeError(f"Received no content for the {ecosystem} dataset manifest")
 
-    return (_extract_etag_header(request.headers.get("ETag", "")), request.json())
+    return (etag, manifest)
 
 
 def _update_manifest(ecosystem: ECOSYSTEM, etag: str) -> tuple[Optional[str], Optional[Manifest]]:
     """
     Get the latest dataset manifest for the given `ecosystem` relative to the given `etag`.
     """
-    request = requests.get(_manifest_url(ecosystem), headers={"If-None-Match": f'W/"{etag}"'}, timeout=5)
+    return _request_manifest(ecosystem, etag)
+
+
+def _request_manifest(
+    ecosystem: ECOSYSTEM,
+    etag: Optional[str] = None,
+) -> tuple[Optional[str], Optional[Manifest]]:
+    """
+    Request the dataset manifest for the given `ecosystem`, conditionally on `etag` if given.
+
+    When an `etag` is provided and the remote manifest has not changed, GitHub replies with
+    an empty `304 Not Modified` response and `(etag, None)` is returned.
+    """
+    headers = {"If-None-Match": f'W/"{etag}"'} if etag else None
+
+    request = _session.get(_manifest_url(ecosystem), headers=headers, timeout=5)
     request.raise_for_status()
 
     if request.status_code == requests.codes.NOT_MODIFIED:
         return (etag, None)
 
-    return (_extract_etag_header(request.headers.get("ETag", "")), request.json())
+    etag_header = request.headers.get("ETag")
+    latest_etag = _extract_etag_header(etag_header) if etag_header else None
+
+    return (latest_etag, _load_manifest(request.content))
+
+
+def _load_manifest(data: bytes) -> Manifest:
+    """
+    Deserialize a dataset manifest, using `orjson` for speed when it is available.
+    """
+    return orjson.loads(data) if orjson else json.loads(data)
+
+
+def _dump_manifest(manifest: Manifest) -> bytes:
+    """
+    Serialize a dataset manifest, using `orjson` for speed when it is available.
+    """
+    return orjson.dumps(manifest) if orjson else json.dumps(manifest).encode()
 
 
 def _extract_etag_header(s: str) -> Optional[str]:
     """
     Extract an ETag from the given header string.
     """
-    match = re.search('W/"(.*)"', s)
+    # GitHub's weak ETags have a fixed shape that can be unwrapped without a regex
+    if len(s) >= 4 and s.startswith('W/"') and s.endswith('"'):
+        return s[3:-1]
+
+    match = _ETAG_HEADER_PATTERN.search(s)
     return match.group(1) if match else None
 
 
@@ -2,14 +2,26 @@
 Defines a package verifier for the OSV.dev advisory database.
 """
 
-import functools
+import concurrent.futures as cf
+import json
 import logging
 import os
 from pathlib import Path
 import re
+from typing import Optional
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util import make_headers
+from urllib3.util.retry import Retry
 
+try:
+    import orjson  # type: ignore
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+
+import scfw
+from scfw.cache import PackageCache
 from scfw.constants import SCFW_HOME_VAR
 from scfw.ecosystem import ECOSYSTEM
 from scfw.package import Package
@@ -18,10 +30,52 @@ from scfw.verifiers.osv_verifier.osv_advisory import OsvAdvisory
 
 _log = logging.getLogger(__name__)
 
-_OSV_DEV_QUERY_URL = "https://api.osv.dev/v1/query"
+_OSV_DEV_QUERY_BATCH_URL = "https://api.osv.dev/v1/querybatch"
+_OSV_DEV_VULNS_URL = "https://api.osv.dev/v1/vulns"
 _OSV_DEV_VULN_URL_PREFIX = "https://osv.dev/vulnerability"
 _OSV_DEV_LIST_URL_PREFIX = "https://osv.dev/list"
 
+# The maximum number of queries the OSV.dev API accepts in a single batch
+_OSV_DEV_QUERY_BATCH_SIZE = 1000
+
+# The HTTP status codes with which OSV.dev rejects a batch because of the queries it contains
+_OSV_DEV_BAD_QUERY_STATUSES = frozenset([400, 422])
+
+# The maximum number of connections to OSV.dev kept open, which bounds useful request concurrency
+_OSV_DEV_POOL_SIZE = 16
+
+# The names by which OSV.dev refers to each supported package ecosystem
+_OSV_ECOSYSTEMS = {ECOSYSTEM.Npm: "npm", ECOSYSTEM.PyPI: "PyPI"}
+
+# A shared session allows connections to OSV.dev to be reused across queries and result pages
+# OSV.dev queries are read-only, so POST requests are as safe to retry as GET requests
+# Advertise every content encoding urllib3 can decode here, including Brotli when installed
+_session = requests.Session()
+_session.headers.update(
+    {
+        "User-Agent": f"scfw/{scfw.__version__}",
+        "Connection": "keep-alive",
+        "Accept": "application/json",
+        **make_headers(accept_encoding=True),
+    }
+)
+_session.mount(
+    "https://",
+    HTTPAdapter(
+        pool_connections=4,
+        pool_maxsize=_OSV_DEV_POOL_SIZE,
+        max_retries=Retry(
+            total=3,
+            backoff_factor=0.3,
+            status_forcelist=[429, 500, 502, 503, 504],
+            allowed_methods=frozenset(["GET", "POST"]),
+        ),
+    ),
+)
+
+# Advisories already fetched from OSV.dev in this process, keyed by ID
+_osv_advisories: dict[str, OsvAdvisory] = {}
+
 OSV_VERIFIER_HOME = Path("osv_verifier/")
 """
 The `OsvVerifier` home directory, relative to `SCFW_HOME`.
@@ -32,12 +86,40 @@ OSV_IGNORE_LIST_DEFAULT = OSV_VERIFIER_HOME / "ignore.txt"
 The default filepath where `OsvVerifier` looks for an ignore list of OSV advisory IDs.
 """
 
+OSV_CACHE_DEFAULT = OSV_VERIFIER_HOME / "cache.db"
+"""
+The filepath where `OsvVerifier` caches OSV.dev query results, relative to `SCFW_HOME`.
+"""
+
+OSV_CACHE_MALICIOUS_TTL = 6 * 60 * 60
+"""
+The time in seconds for which `OsvVerifier` caches query results containing a malicious
+package (MAL) advisory.
+"""
+
+OSV_CACHE_DEFAULT_TTL = 15 * 60
+"""
+The time in seconds for which `OsvVerifier` caches all other query results.  These expire
+quickly so that newly published MAL advisories are not masked by a stale clean result for long.
+"""
+
 OSV_IGNORE_LIST_VAR = "SCFW_OSV_VERIFIER_IGNORE"
 """
 The environment variable under which `OsvVerifier` looks for a filepath to an ignore list
 of OSV advisory IDs.
 """
 
+OSV_CONCURRENCY_DEFAULT = 8
+"""
+The default maximum number of concurrent requests `OsvVerifier` makes to the OSV.dev API.
+"""
+
+OSV_CONCURRENCY_VAR = "SCFW_OSV_CONCURRENCY"
+"""
+The environment variable under which `OsvVerifier` looks for a user-provided maximum number
+of concurrent requests to make to the OSV.dev API, expressed as a positive integer.
+"""
+
 
 class OsvVerifier(PackageVerifier):
     """
@@ -76,6 +158,35 @@ class OsvVerifier(PackageVerifier):
         except Exception as e:
             _log.warning(f"Failed to read OSV advisory ignore list: {e}")
 
+        self._cache = None
+        if (home_dir := os.getenv(SCFW_HOME_VAR)):
+            try:
+                cache_file = Path(home_dir) / OSV_CACHE_DEFAULT
+                cache_file.parent.mkdir(parents=True, exist_ok=True)
+                self._cache = PackageCache[str](cache_file, "osv_query_results", _cache_ttl)
+            except Exception as e:
+                _log.warning(f"Failed to set up cache for OSV.dev verifier: {e}")
+
+        self.concurrency = OSV_CONCURRENCY_DEFAULT
+        if (c := os.getenv(OSV_CONCURRENCY_VAR)):
+            try:
+                concurrency = int(c)
+                if concurrency < 1:
+                    raise ValueError("Concurrency must be positive")
+                self.concurrency = concurrency
+            except Exception:
+                _log.warning(
+                    f"Invalid OSV.dev request concurrency '{c}', using default value of {OSV_CONCURRENCY_DEFAULT}"
+                )
+
+        # Requests beyond the size of the connection pool would open connections only to discard them
+        if self.concurrency > _OSV_DEV_POOL_SIZE:
+            _log.warning(
+                f"OSV.dev request concurrency {self.concurrency} exceeds the maximum of {_OSV_DEV_POOL_SIZE}, "
+                f"using {_OSV_DEV_POOL_SIZE}"
+            )
+            self.concurrency = _OSV_DEV_POOL_SIZE
+
     @classmethod
     def name(cls) -> str:
         """
@@ -115,95 +226,273 @@ class OsvVerifier(PackageVerifier):
             UnverifiablePackage:
                 The given package is from an unsupported ecosystem or has a known artifact
                 source other than the ecosystem's main registry.
-            requests.HTTPError:
-                An error occurred while querying a package against the OSV.dev API.
         """
-        def finding(osv: OsvAdvisory) -> str:
-            kind = "malicious package " if osv.id.startswith("MAL") else ""
+        result = self.verify_batch([package])[package]
+        if isinstance(result, UnverifiablePackage):
+            raise result
+
+        return result
+
+    def verify_batch(self, packages: list[Package]) -> dict[Package, set[Finding] | UnverifiablePackage]:
+        """
+        Query the given packages against the OSV.dev database in bulk.
+
+        The packages are first queried via the OSV.dev batch query API, which returns only
+        the IDs of matching advisories.  Full advisories are then fetched once per distinct
+        ID in order to determine their severities.
+
+        Args:
+            packages: The `list` of `Package` to query.
+
+        Returns:
+            A `dict` mapping each given `Package` either to the `set[Finding]` obtained for
+            it by querying the OSV.dev API, as in `verify()`, or to an `UnverifiablePackage`
+            exception if the package is not within the scope of this verifier.
+        """
+        def finding(prefix: str, osv: OsvAdvisory) -> str:
             severity_tag = f"[{osv.severity}] " if osv.severity else ""
-            return (
-                f"An OSV.dev {kind}advisory exists for package {package}:\n"
-                f"  * {severity_tag}{_OSV_DEV_VULN_URL_PREFIX}/{osv.id}"
-            )
+            return f"{prefix}{severity_tag}{_OSV_DEV_VULN_URL_PREFIX}/{osv.id}"
 
-        def failure_message() -> str:
+        def failure_message(package: Package) -> str:
             return (
                 f"Failed to verify package {package} via the OSV.dev API.\n"
                 f"Before proceeding, please check the OSV.dev website for advisories related to this package.\n"
                 f"DO NOT PROCEED if the package has advisories with a MAL ID: it is very likely malicious.\n"
-                f"  * {_OSV_DEV_LIST_URL_PREFIX}?q={package.name}&ecosystem={str(package.ecosystem)}"
+                f"  * {_OSV_DEV_LIST_URL_PREFIX}?q={package.name}&ecosystem={_OSV_ECOSYSTEMS[package.ecosystem]}"
             )
 
-        if package.ecosystem not in self.supported_ecosystems():
-            raise UnverifiablePackage(f"Package ecosystem {package.ecosystem} is not supported")
+        def is_ignored(osv_id: str) -> bool:
+            return any(re.fullmatch(ignored, osv_id) for ignored in self.ignored_osv_ids)
 
-        if package.source is not None and not package.has_registry_source():
-            raise UnverifiablePackage(f"Cannot verify package with non-{package.ecosystem} registry source")
-        if package.source is None:
-            _log.warning(
-                f"{self.name()}: Unknown source for package {package}: assuming {package.ecosystem} registry source"
-            )
+        results: dict[Package, set[Finding] | UnverifiablePackage] = {}
 
-        vulns = []
-        query: dict[str, str | dict[str, str] | None] = {
-            "version": package.version,
-            "package": {
-                "name": package.name,
-                "ecosystem": str(package.ecosystem)
-            }
-        }
-
-        try:
-            while True:
-                # The OSV.dev API is sometimes quite slow, hence the generous timeout
-                request = requests.post(_OSV_DEV_QUERY_URL, json=query, timeout=10)
-                request.raise_for_status()
-                response = request.json()
+        # Packages differing only in their (registry) source share a single OSV.dev query
+        queryable: dict[Package, Package] = {}
+        representatives: dict[tuple[ECOSYSTEM, str, str], Package] = {}
 
-                if (response_vulns := response.get("vulns")):
-                    vulns.extend(response_vulns)
+        for package in packages:
+            if package.ecosystem not in _OSV_ECOSYSTEMS:
+                results[package] = UnverifiablePackage(f"Package ecosystem {package.ecosystem} is not supported")
+                continue
 
-                query["page_token"] = response.get("next_page_token")
-
-                if not query["page_token"]:
-                    break
+            if package.source is not None and not package.has_registry_source():
+                results[package] = UnverifiablePackage(
+                    f"Cannot verify package with non-{package.ecosystem} registry source"
+                )
+                continue
+            if package.source is None:
+                _log.warning(
+                    f"{self.name()}: Unknown source for package {package}: assuming {package.ecosystem} registry source"
+                )
 
-            if not vulns:
-                return set()
+            queryable[package] = representatives.setdefault(
+                (package.ecosystem, package.name, package.version), package
+            )
 
-            osvs = set(map(OsvAdvisory.from_json, filter(lambda vuln: vuln.get("id"), vulns)))
-            mal_osvs = set(filter(lambda osv: osv.id.startswith("MAL"), osvs))
-            non_mal_osvs = set(
-                filter(
-                    lambda osv: not any(re.fullmatch(ignored, osv.id) for ignored in self.ignored_osv_ids),
-                    osvs - mal_osvs,
-                )
+        unique_queryable = list(representatives.values())
+
+        cached_osv_ids = {}
+        if self._cache:
+            try:
+                cached_osv_ids = {
+                    package: set(osv_ids.split()) for package, osv_ids in self._cache.get(unique_queryable).items()
+                }
+            except Exception as e:
+                _log.warning(f"Failed to read OSV.dev query results from cache: {e}")
+
+        with cf.ThreadPoolExecutor(max_workers=self.concurrency) as executor:
+            osv_ids, failed = _query_batch(
+                executor,
+                [package for package in unique_queryable if package not in cached_osv_ids],
             )
 
-            osv_sort_key = functools.cmp_to_key(OsvAdvisory.compare_severities)
-            sorted_mal_osvs = sorted(mal_osvs, reverse=True, key=osv_sort_key)
-            sorted_non_mal_osvs = sorted(non_mal_osvs, reverse=True, key=osv_sort_key)
+            if self._cache and osv_ids:
+                try:
+                    self._cache.put({package: " ".join(ids) for package, ids in osv_ids.items()})
+                except Exception as e:
+                    _log.warning(f"Failed to write OSV.dev query results to cache: {e}")
+            osv_ids.update(cached_osv_ids)
+
+            # Partition each package's advisory IDs in a single pass, filtering ignored IDs
+            # before fetching any advisories (MAL advisories are never ignored)
+            partitioned_osv_ids: dict[Package, tuple[list[str], list[str]]] = {}
+            unique_osv_ids: set[str] = set()
+            for package, package_osv_ids in osv_ids.items():
+                mal_osv_ids, non_mal_osv_ids = [], []
+                for osv_id in package_osv_ids:
+                    if osv_id.startswith("MAL"):
+                        mal_osv_ids.append(osv_id)
+                    elif not is_ignored(osv_id):
+                        non_mal_osv_ids.append(osv_id)
+                partitioned_osv_ids[package] = (mal_osv_ids, non_mal_osv_ids)
+                unique_osv_ids.update(mal_osv_ids, non_mal_osv_ids)
+
+            osvs = dict(zip(unique_osv_ids, executor.map(_get_advisory, unique_osv_ids)))
+
+        for package, representative in queryable.items():
+            if representative in failed:
+                results[package] = {Finding(self.name(), FindingSeverity.WARNING, failure_message(package))}
+                continue
+
+            mal_osv_ids, non_mal_osv_ids = partitioned_osv_ids.get(representative, ([], []))
+            mal_osvs = sorted((osvs[osv_id] for osv_id in mal_osv_ids), reverse=True)
+            non_mal_osvs = sorted((osvs[osv_id] for osv_id in non_mal_osv_ids), reverse=True)
+
+            # The text preceding the advisory link is the same for all of a package's findings of a kind
+            mal_prefix = f"An OSV.dev malicious package advisory exists for package {package}:\n  * "
+            non_mal_prefix = f"An OSV.dev advisory exists for package {package}:\n  * "
 
             critical_findings = {
-                Finding(self.name(), FindingSeverity.CRITICAL, finding(osv)) for osv in sorted_mal_osvs
+                Finding(self.name(), FindingSeverity.CRITICAL, finding(mal_prefix, osv)) for osv in mal_osvs
             }
             warning_findings = {
-                Finding(self.name(), FindingSeverity.WARNING, finding(osv)) for osv in sorted_non_mal_osvs
+                Finding(self.name(), FindingSeverity.WARNING, finding(non_mal_prefix, osv)) for osv in non_mal_osvs
             }
 
-            return critical_findings | warning_findings
+            results[package] = critical_findings | warning_findings
 
-        except requests.exceptions.RequestException as e:
-            _log.warning(f"Failed to query OSV.dev API for package {package}: {e}")
-            return {
-                Finding(self.name(), FindingSeverity.WARNING, failure_message())
-            }
+        return results
 
-        except Exception as e:
-            _log.warning(f"Verification failed for package {package}: {e}")
-            return {
-                Finding(self.name(), FindingSeverity.WARNING, failure_message())
-            }
+
+def _cache_ttl(osv_ids: str) -> int:
+    """
+    Return the time in seconds for which to cache the given space-separated OSV advisory IDs.
+    """
+    if any(osv_id.startswith("MAL") for osv_id in osv_ids.split()):
+        return OSV_CACHE_MALICIOUS_TTL
+    return OSV_CACHE_DEFAULT_TTL
+
+
+class _BadBatchQuery(Exception):
+    """
+    An OSV.dev batch query was rejected or answered inconsistently because of the queries it contains.
+    """
+    pass
+
+
+def _query_batch(
+    executor: cf.Executor,
+    packages: list[Package],
+) -> tuple[dict[Package, set[str]], set[Package]]:
+    """
+    Query the given packages against the OSV.dev batch query API, dispatching the
+    requests for independent chunks of queries and their result pages via `executor`.
+
+    Returns:
+        A `tuple` containing a `dict` mapping each successfully queried package to the IDs
+        of all OSV advisories affecting it and the `set` of packages for which the query failed.
+    """
+    def package_query(package: Package, page_token: Optional[str] = None) -> dict:
+        query: dict = {
+            "version": package.version,
+            "package": {"name": package.name, "ecosystem": _OSV_ECOSYSTEMS[package.ecosystem]},
+        }
+        if page_token:
+            query["page_token"] = page_token
+        return query
+
+    def query_chunk(chunk: list[tuple[Package, Optional[str]]]) -> list[dict]:
+        # The OSV.dev API is sometimes quite slow, hence the generous timeout
+        request = _session.post(
+            _OSV_DEV_QUERY_BATCH_URL,
+            json={"queries": [package_query(package, page_token) for package, page_token in chunk]},
+            timeout=30,
+        )
+        if request.status_code in _OSV_DEV_BAD_QUERY_STATUSES:
+            raise _BadBatchQuery(f"OSV.dev rejected the batch query with status {request.status_code}")
+        request.raise_for_status()
+
+        # Never treat a response that is not a well-formed batch result as clean
+        response = _parse_json(request)
+        batch_results = response.get("results") if isinstance(response, dict) else None
+
+        if not isinstance(batch_results, list) or not all(isinstance(result, dict) for result in batch_results):
+            raise RuntimeError("OSV.dev batch query returned a malformed response")
+        if len(batch_results) != len(chunk):
+            raise _BadBatchQuery("OSV.dev batch query returned an unexpected number of results")
+
+        return batch_results
+
+    osv_ids: dict[Package, set[str]] = {}
+    failed: set[Package] = set()
+
+    queries: list[tuple[Package, Optional[str]]] = [(package, None) for package in packages]
+    pending = {
+        executor.submit(query_chunk, chunk): chunk
+        for chunk in (
+            queries[i:i + _OSV_DEV_QUERY_BATCH_SIZE] for i in range(0, len(queries), _OSV_DEV_QUERY_BATCH_SIZE)
+        )
+    }
+
+    while pending:
+        done, _ = cf.wait(pending, return_when=cf.FIRST_COMPLETED)
+        for future in done:
+            chunk = pending.pop(future)
+
+            try:
+                batch_results = future.result()
+            except _BadBatchQuery as e:
+                # Retry each half of a rejected chunk separately so that a single bad query
+                # only causes the verification of its own package to fail
+                if len(chunk) > 1:
+                    _log.debug(f"Failed to query OSV.dev API for {len(chunk)} packages, retrying in halves: {e}")
+                    for half in (chunk[:len(chunk) // 2], chunk[len(chunk) // 2:]):
+                        pending[executor.submit(query_chunk, half)] = half
+                else:
+                    _log.warning(f"Failed to query OSV.dev API for package {chunk[0][0]}: {e}")
+                    failed.add(chunk[0][0])
+                continue
+            except Exception as e:
+                # Transport errors and retryable statuses have already been retried by the
+                # session, so resending smaller chunks would only add load to a degraded API
+                _log.warning(f"Failed to query OSV.dev API for {len(chunk)} packages: {e}")
+                failed.update(package for package, _ in chunk)
+                continue
+
+            for (package, _), result in zip(chunk, batch_results):
+                package_osv_ids = osv_ids.setdefault(package, set())
+                for vuln in result.get("vulns") or ():
+                    if (osv_id := vuln.get("id")):
+                        package_osv_ids.add(osv_id)
+
+                # Each query's results are paginated independently of the others in the batch,
+                # so each package's next page is fetched separately and may fail on its own
+                if (page_token := result.get("next_page_token")):
+                    next_page = [(package, page_token)]
+                    pending[executor.submit(query_chunk, next_page)] = next_page
+
+    for package in failed:
+        osv_ids.pop(package, None)
+
+    return osv_ids, failed
+
+
+def _get_advisory(osv_id: str) -> OsvAdvisory:
+    """
+    Fetch the OSV advisory with the given ID, reusing any previously fetched copy.
+
+    If the advisory cannot be fetched, an `OsvAdvisory` with unknown severity is returned.
+    """
+    if (osv := _osv_advisories.get(osv_id)):
+        return osv
+
+    try:
+        request = _session.get(f"{_OSV_DEV_VULNS_URL}/{osv_id}", timeout=10)
+        request.raise_for_status()
+        osv = OsvAdvisory.from_json(_parse_json(request))
+    except Exception as e:
+        _log.warning(f"Failed to fetch OSV advisory {osv_id}: {e}")
+        return OsvAdvisory(osv_id, None)
+
+    _osv_advisories[osv_id] = osv
+    return osv
+
+
+def _parse_json(response: requests.Response) -> dict:
+    """
+    Decode the JSON body of an OSV.dev API response, using `orjson` for speed when it is available.
+    """
+    return orjson.loads(response.content) if orjson else json.loads(response.content)
 
 
 def load_verifier() -> PackageVerifier:
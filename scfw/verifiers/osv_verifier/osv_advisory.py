@@ -4,11 +4,10 @@ Provides a representation of OSV advisories for use in `OsvVerifier`.
 
 from dataclasses import dataclass
 from enum import Enum
+import functools
 from typing import Optional
 from typing_extensions import Self
 
-from cvss import CVSS2, CVSS3, CVSS4  # type: ignore
-
 
 class Severity(Enum):
     """
@@ -64,14 +63,18 @@ class Severity(Enum):
         Raises:
             ValueError: The given string does not refer to a valid `Severity`.
         """
-        mappings = {f"{severity}".lower(): severity for severity in cls}
-
-        if (severity := mappings.get(s.lower())):
+        if (severity := _SEVERITIES_BY_NAME.get(s.lower())):
             return severity
 
         raise ValueError(f"Invalid severity '{s}'")
 
 
+_SEVERITIES_BY_NAME = {f"{severity}".lower(): severity for severity in Severity}
+"""
+Maps the lowercased printable name of each `Severity` to that `Severity`.
+"""
+
+
 class OsvSeverityType(str, Enum):
     """
     The various severity score types defined in the OSV standard.
@@ -82,7 +85,7 @@ class OsvSeverityType(str, Enum):
     Ubuntu = "Ubuntu"
 
 
-@dataclass(eq=True, frozen=True)
+@dataclass(eq=True, frozen=True, slots=True)
 class OsvSeverityScore:
     """
     A typed severity score used in assigning severities to OSV advisories.
@@ -119,20 +122,35 @@ class OsvSeverityScore:
         Returns:
             The computed `Severity` of the given `OsvSeverityScore`.
         """
-        match self.type:
-            case OsvSeverityType.CVSS_V2:
-                severity_str = CVSS2(self.score).severities()[0]
-            case OsvSeverityType.CVSS_V3:
-                severity_str = CVSS3(self.score).severities()[0]
-            case OsvSeverityType.CVSS_V4:
-                severity_str = CVSS4(self.score).severity
-            case OsvSeverityType.Ubuntu:
-                severity_str = "None" if self.score == "Negligible" else self.score
+        return _compute_severity(self.type, self.score)
 
-        return Severity.from_string(severity_str) if severity_str else Severity.Non
 
+@functools.lru_cache(maxsize=4096)
+def _compute_severity(type: OsvSeverityType, score: str) -> Severity:
+    """
+    Compute the `Severity` of a typed severity score.
 
-@dataclass(eq=True, frozen=True)
+    Parsing CVSS vectors is comparatively expensive and many advisories share the
+    same vector, so results are memoized.
+    """
+    # Importing `cvss` is deferred until a score actually needs parsing, as most runs have no advisories
+    match type:
+        case OsvSeverityType.CVSS_V2:
+            from cvss import CVSS2  # type: ignore
+            severity_str = CVSS2(score).severities()[0]
+        case OsvSeverityType.CVSS_V3:
+            from cvss import CVSS3  # type: ignore
+            severity_str = CVSS3(score).severities()[0]
+        case OsvSeverityType.CVSS_V4:
+            from cvss import CVSS4  # type: ignore
+            severity_str = CVSS4(score).severity
+        case OsvSeverityType.Ubuntu:
+            severity_str = "None" if score == "Negligible" else score
+
+    return Severity.from_string(severity_str) if severity_str else Severity.Non
+
+
+@dataclass(eq=True, frozen=True, slots=True)
 class OsvAdvisory:
     """
     A representation of an OSV advisory containing only the fields relevant to
@@ -141,8 +159,35 @@ class OsvAdvisory:
     id: str
     severity: Optional[Severity]
 
-    @classmethod
-    def compare_severities(cls, lhs: Self, rhs: Self) -> int:
+    def __eq__(self, other: object) -> bool:
+        """
+        Compare two `OsvAdvisory` instances for equality.
+
+        OSV advisory IDs are globally unique, so two advisories are equal if and
+        only if they have the same ID.
+
+        Args:
+            self: The `OsvAdvisory` to be compared on the left-hand side
+            other: The object to be compared on the right-hand side
+
+        Returns:
+            A `bool` indicating whether the two given objects are equal.
+        """
+        if not isinstance(other, OsvAdvisory):
+            return NotImplemented
+
+        return self.id == other.id
+
+    def __hash__(self) -> int:
+        """
+        Hash an `OsvAdvisory` by its globally unique ID.
+
+        Returns:
+            The hash of the advisory's ID.
+        """
+        return hash(self.id)
+
+    def __lt__(self, other: Self) -> bool:
         """
         Compare two `OsvAdvisory` instances on the basis of their severities such that
         advisories with no severities are sorted lower than those with severities.
@@ -152,23 +197,23 @@ class OsvAdvisory:
             other: The `OsvAdvisory` to be compared on the right-hand side
 
         Returns:
-            An `int` indicating whether the first `OsvAdvisory` is less than, equal to
-            or greater than the second one.
+            A `bool` indicating whether `<` holds between the two given `OsvAdvisory`.
 
         Raises:
-            TypeError: One of the given arguments is not an `OsvAdvisory`.
+            TypeError: The other argument given was not an `OsvAdvisory`.
         """
-        if not (isinstance(lhs, cls) and isinstance(rhs, cls)):
-            raise TypeError("Received incompatible argument types while comparing OSV severities")
+        if self.__class__ is not other.__class__:
+            raise TypeError(
+                f"'<' not supported between instances of '{self.__class__}' and '{other.__class__}'"
+            )
 
-        if lhs.severity == rhs.severity:
-            return 0
-        if lhs.severity is None:
-            return -1
-        if rhs.severity is None:
-            return 1
+        return self._severity_rank() < other._severity_rank()
 
-        return -1 if lhs.severity < rhs.severity else 1
+    def _severity_rank(self) -> int:
+        """
+        Return an integer rank for the advisory's severity, with missing severities ranked lowest.
+        """
+        return self.severity.value if self.severity else -1
 
     @classmethod
     def from_json(cls, osv_json: dict) -> Self:
@@ -188,7 +233,8 @@ class OsvAdvisory:
         if not id:
             raise ValueError("Encountered OSV advisory with missing ID field")
 
-        scores = list(map(OsvSeverityScore.from_json, osv_json.get("severity", [])))
-        severity = max(map(lambda score: score.severity(), scores)) if scores else None
+        severity = None
+        if (scores := osv_json.get("severity")):
+            severity = max(OsvSeverityScore.from_json(score).severity() for score in scores)
 
         return cls(id, severity)
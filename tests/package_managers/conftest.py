@@ -19,18 +19,22 @@ from .npm_fixtures import (  # noqa: F401
     npm_project_local_dependency_lockfile,
 )
 from .pip_fixtures import (  # noqa: F401
+    init_pip_state,
     new_pip_project,
     new_pip_project_installed,
     pip_project_local_dependency,
     pip_project_local_dependency_installed,
     pip_project_remote_dependency,
     pip_project_remote_dependency_installed,
+    test_target,
 )
 from .poetry_fixtures import (  # noqa: F401
     new_poetry_project,
     poetry_project_lock_latest,
+    poetry_project_template,
     poetry_project_target_latest,
     poetry_project_target_latest_lock_previous,
     poetry_project_target_previous,
     poetry_project_target_previous_lock_latest,
+    shared_poetry_project,
 )
@@ -2,6 +2,8 @@
 Provides a collection of common fixtures for the pip tests.
 """
 
+import importlib.metadata
+import os
 from pathlib import Path
 import subprocess
 import sys
@@ -9,8 +11,13 @@ from tempfile import TemporaryDirectory
 import textwrap
 from typing import Optional
 
+from packaging.utils import canonicalize_name
 import pytest
 
+# Skip pip's check for a newer version of itself, a network round trip on every run,
+# and make pip fail rather than wait if it ever needs to prompt
+PIP_COMMAND_PREFIX = [sys.executable, "-m", "pip", "--disable-pip-version-check", "--no-input"]
+
 TEST_PACKAGE_NAME = "foo"
 TEST_PACKAGE_VERSION = "0.1.0"
 
@@ -21,6 +28,25 @@ LOCAL_PACKAGE_NAME = "bar"
 LOCAL_PACKAGE_VERSION = "1.0.0"
 
 
+@pytest.fixture(scope="session")
+def init_pip_state() -> frozenset[str]:
+    """
+    The pip installation state before running any tests.
+
+    This is a fixture rather than a module constant so that collecting the tests
+    (e.g., with `--collect-only` or `-k`) does not require running pip.
+    """
+    return pip_list()
+
+
+@pytest.fixture(scope="session")
+def test_target(init_pip_state: frozenset[str]) -> str:
+    """
+    A fresh (not currently installed) package target to use for testing.
+    """
+    return select_test_install_target(read_top_pypi_packages(), init_pip_state)
+
+
 @pytest.fixture
 def new_pip_project():
     """
@@ -229,3 +255,44 @@ def get_system_pip_version() -> str:
 
     # All supported versions adhere to this format
     return p.stdout.strip().split()[1]
+
+
+def pip_list() -> frozenset[str]:
+    """
+    Get the current state of packages installed via pip.
+
+    The state is the set of lowercased `name==version` strings of the installed
+    distributions, as in `pip list --format freeze`.  The distributions are read
+    in-process rather than by running `pip list`, which costs a full pip startup.
+    """
+    return frozenset(
+        f"{distribution.metadata['Name']}=={distribution.version}".lower()
+        for distribution in importlib.metadata.distributions()
+        if distribution.metadata["Name"]
+    )
+
+
+def read_top_pypi_packages() -> set[str]:
+    """
+    Read the names of the top PyPI packages used as candidate test targets.
+    """
+    test_dir = os.path.dirname(os.path.realpath(__file__, strict=True))
+    top_packages_file = os.path.join(test_dir, "top_pypi_packages.txt")
+    with open(top_packages_file) as f:
+        return set(f.read().split())
+
+
+def select_test_install_target(top_packages: set[str], installed_packages: frozenset[str]) -> str:
+    """
+    Select a test target from the given top packages that is not among the given
+    installed packages, as returned by `pip_list()`.
+
+    This allows us to be certain when testing that nothing was installed in a dry-run.
+    """
+    installed = {canonicalize_name(line.split("==")[0]) for line in installed_packages}
+    candidates = {canonicalize_name(package) for package in top_packages} - installed
+
+    if not candidates:
+        raise RuntimeError("Unable to select a target package for testing")
+
+    return candidates.pop()
@@ -3,9 +3,9 @@ Provides a collection of common fixtures for the Poetry tests.
 """
 
 from pathlib import Path
+import shutil
 import subprocess
 import sys
-from tempfile import TemporaryDirectory
 
 import pytest
 import requests
@@ -26,96 +26,123 @@ TARGET_LATEST = TARGET_RELEASES[-1]
 TARGET_PREVIOUS = TARGET_RELEASES[-2]
 
 
+@pytest.fixture(scope="session")
+def poetry_project_template(tmp_path_factory):
+    """
+    Initialize and lock an empty Poetry project once per session, to be copied
+    into each test project rather than re-initialized and re-locked every time.
+    """
+    template = tmp_path_factory.mktemp("poetry_template")
+    subprocess.run(["poetry", "init", "--no-interaction", "--name", TEST_PROJECT_NAME], check=True, cwd=template)
+    subprocess.run(["poetry", "lock"], check=True, cwd=template)
+
+    return template
+
+
 @pytest.fixture
-def new_poetry_project():
+def new_poetry_project(tmp_path_factory, poetry_project_template):
     """
     Initialize a clean Poetry project for use in testing.
     """
-    tempdir = TemporaryDirectory()
-    _init_poetry_project(tempdir.name, TEST_PROJECT_NAME)
+    project = tmp_path_factory.mktemp("poetry")
+    _init_poetry_project(project, poetry_project_template)
 
-    yield tempdir.name
+    return str(project)
 
-    tempdir.cleanup()
+
+@pytest.fixture(scope="module")
+def shared_poetry_project(tmp_path_factory, poetry_project_template):
+    """
+    Initialize a clean Poetry project to be shared by the tests of a module.
+
+    This is only for tests that verify that the commands they run leave the
+    project's installation state unchanged, which makes sharing it safe.  The
+    project's initial installation state is returned alongside it so that every
+    test compares against the same snapshot rather than one taken after the tests
+    that ran before it.
+    """
+    project = tmp_path_factory.mktemp("poetry")
+    _init_poetry_project(project, poetry_project_template)
+
+    return str(project), poetry_show(project)
 
 
 @pytest.fixture
-def poetry_project_target_latest():
+def poetry_project_target_latest(tmp_path_factory, poetry_project_template):
     """
     Initialize a Poetry project with the latest version of `TARGET` as a dependency.
     """
-    tempdir = TemporaryDirectory()
-    _init_poetry_project(tempdir.name, TEST_PROJECT_NAME, [(TARGET, TARGET_LATEST)])
-
-    yield tempdir.name
+    project = tmp_path_factory.mktemp("poetry")
+    _init_poetry_project(project, poetry_project_template, [(TARGET, TARGET_LATEST)])
 
-    tempdir.cleanup()
+    return str(project)
 
 
 @pytest.fixture
-def poetry_project_target_previous():
+def poetry_project_target_previous(tmp_path_factory, poetry_project_template):
     """
     Initialize a Poetry project with the previous version of `TARGET` as a dependency.
     """
-    tempdir = TemporaryDirectory()
-    _init_poetry_project(tempdir.name, TEST_PROJECT_NAME, [(TARGET, TARGET_PREVIOUS)])
+    project = tmp_path_factory.mktemp("poetry")
+    _init_poetry_project(project, poetry_project_template, [(TARGET, TARGET_PREVIOUS)])
 
-    yield tempdir.name
-
-    tempdir.cleanup()
+    return str(project)
 
 
 @pytest.fixture
-def poetry_project_target_latest_lock_previous():
+def poetry_project_target_latest_lock_previous(tmp_path_factory, poetry_project_template):
     """
     Initialize a Poetry project where the latest version of `TARGET` has been installed but
     the previous version of it is an as-yet uninstalled dependency of the project.
     """
-    tempdir = TemporaryDirectory()
-    _init_poetry_project(tempdir.name, TEST_PROJECT_NAME, [(TARGET, TARGET_LATEST)])
-    subprocess.run(["poetry", "add", "--lock", f"{TARGET}=={TARGET_PREVIOUS}"], check=True, cwd=tempdir.name)
-
-    yield tempdir.name
+    project = tmp_path_factory.mktemp("poetry")
+    _init_poetry_project(project, poetry_project_template, [(TARGET, TARGET_LATEST)])
+    subprocess.run(["poetry", "add", "--lock", f"{TARGET}=={TARGET_PREVIOUS}"], check=True, cwd=project)
 
-    tempdir.cleanup()
+    return str(project)
 
 
 @pytest.fixture
-def poetry_project_target_previous_lock_latest():
+def poetry_project_target_previous_lock_latest(tmp_path_factory, poetry_project_template):
     """
     Initialize a Poetry project where the previous version of `TARGET` has been installed but
     the latest version of it is an as-yet uninstalled dependency of the project.
     """
-    tempdir = TemporaryDirectory()
-    _init_poetry_project(tempdir.name, TEST_PROJECT_NAME, [(TARGET, TARGET_PREVIOUS)])
-    subprocess.run(["poetry", "add", "--lock", f"{TARGET}=={TARGET_LATEST}"], check=True, cwd=tempdir.name)
+    project = tmp_path_factory.mktemp("poetry")
+    _init_poetry_project(project, poetry_project_template, [(TARGET, TARGET_PREVIOUS)])
+    subprocess.run(["poetry", "add", "--lock", f"{TARGET}=={TARGET_LATEST}"], check=True, cwd=project)
 
-    yield tempdir.name
-
-    tempdir.cleanup()
+    return str(project)
 
 
 @pytest.fixture
-def poetry_project_lock_latest():
+def poetry_project_lock_latest(tmp_path_factory, poetry_project_template):
     """
     Initialize a Poetry project where the latest version of `TARGET` is an as-yet
     uninstalled dependency.
     """
-    tempdir = TemporaryDirectory()
-    _init_poetry_project(tempdir.name, TEST_PROJECT_NAME)
-    subprocess.run(["poetry", "add", "--lock", f"{TARGET}=={TARGET_LATEST}"], check=True, cwd=tempdir.name)
+    project = tmp_path_factory.mktemp("poetry")
+    _init_poetry_project(project, poetry_project_template)
+    subprocess.run(["poetry", "add", "--lock", f"{TARGET}=={TARGET_LATEST}"], check=True, cwd=project)
+
+    return str(project)
 
-    yield tempdir.name
 
-    tempdir.cleanup()
+def poetry_show(project_dir) -> str:
+    """
+    Get the current state of packages installed via Poetry.
+    """
+    poetry_show = subprocess.run(["poetry", "show"], check=True, cwd=project_dir, text=True, capture_output=True)
+    return poetry_show.stdout.lower()
 
 
-def _init_poetry_project(directory, name, dependencies=None):
+def _init_poetry_project(directory, template, dependencies=None):
     """
-    Initialize a fresh Poetry project in `directory` with the given `dependencies`.
+    Initialize a fresh Poetry project in `directory` from the project `template`
+    with the given `dependencies`.
     """
-    subprocess.run(["poetry", "init", "--no-interaction", "--name", name], check=True, cwd=directory)
-    subprocess.run(["poetry", "lock"], check=True, cwd=directory)
+    # The template holds no venv, which cannot be relocated, so it is safe to copy
+    shutil.copytree(template, directory, dirs_exist_ok=True)
 
     # Create a separate venv for Poetry to use during testing
     venv_path = Path(directory) / "venv"
@@ -123,6 +150,7 @@ def _init_poetry_project(directory, name, dependencies=None):
     subprocess.run([sys.executable, "-m", "venv", venv_path], check=True)
     subprocess.run(["poetry", "env", "use", venv_python_path], check=True, cwd=directory)
 
+    # Adding all dependencies at once resolves and rewrites the lockfile only once
     if dependencies:
-        for package, version in dependencies:
-            subprocess.run(["poetry", "add", f"{package}=={version}"], check=True, cwd=directory)
+        dependency_specs = [f"{package}=={version}" for package, version in dependencies]
+        subprocess.run(["poetry", "add", *dependency_specs], check=True, cwd=directory)
@@ -23,6 +23,7 @@ from .npm_fixtures import (
     init_npm_project,
 )
 
+# The project fixture is shared across these cases, which run as subtests of a single test
 PREVENT_INSTALL_TEST_CASES = list(
     itertools.product(
         [
@@ -56,7 +57,13 @@ def test_npm_version_output():
     """
     Test that `npm --version` has the required format.
     """
-    version_str = subprocess.run(["npm", "--version"], check=True, text=True, capture_output=True)
+    version_str = subprocess.run(
+        ["npm", "--version"],
+        check=True,
+        text=True,
+        capture_output=True,
+        stdin=subprocess.DEVNULL,
+    )
     version.parse(version_str.stdout.strip())
 
 
@@ -71,6 +78,7 @@ def test_npm_prefix_output(new_npm_project):
             text=True,
             capture_output=True,
             cwd=path,
+            stdin=subprocess.DEVNULL,
         )
         return Path(npm_prefix.stdout.strip())
 
@@ -104,6 +112,7 @@ def test_npm_prefix_output_empty_directory(empty_directory):
         text=True,
         capture_output=True,
         cwd=empty_directory,
+        stdin=subprocess.DEVNULL,
     )
     prefix_path = Path(npm_prefix.stdout.strip())
 
@@ -257,6 +266,7 @@ def test_npm_install_package_lock_only_ignore_scripts(npm_project_dependency_lat
         text=True,
         capture_output=True,
         cwd=npm_project_dependency_latest,
+        stdin=subprocess.DEVNULL,
     )
 
     assert (npm_project_dependency_latest / "package-lock.json").is_file()
@@ -292,6 +302,7 @@ def test_npm_install_ignore_scripts(npm_project_dependency_latest):
         text=True,
         capture_output=True,
         cwd=npm_project_dependency_latest,
+        stdin=subprocess.DEVNULL,
     )
     assert test_script_body in p.stdout
 
@@ -302,79 +313,76 @@ def test_npm_install_ignore_scripts(npm_project_dependency_latest):
         text=True,
         capture_output=True,
         cwd=npm_project_dependency_latest,
+        stdin=subprocess.DEVNULL,
     )
     assert test_script_body not in p.stdout
 
 
-@pytest.mark.parametrize("command_line, test_target", PREVENT_INSTALL_TEST_CASES)
 def test_options_prevent_install_empty_directory(
     empty_directory,
-    command_line: list[str],
-    test_target: str,
+    subtests: pytest.Subtests,
 ):
     """
     Test that the `-h`/`--help` and `--dry-run` options prevent an `npm install`
     command from running in an empty directory.
     """
-    backend_test_no_install(empty_directory, command_line, test_target)
+    for command_line, test_target in PREVENT_INSTALL_TEST_CASES:
+        with subtests.test(command_line=command_line):
+            backend_test_no_install(empty_directory, command_line, test_target)
 
 
-@pytest.mark.parametrize("command_line, test_target", PREVENT_INSTALL_TEST_CASES)
 def test_options_prevent_install_new_npm_project(
     new_npm_project,
-    command_line: list[str],
-    test_target: str,
+    subtests: pytest.Subtests,
 ):
     """
     Test that the `-h`/`--help` and `--dry-run` options prevent an `npm install`
     command from running in a new npm project.
     """
-    backend_test_no_install(new_npm_project, command_line, test_target)
+    for command_line, test_target in PREVENT_INSTALL_TEST_CASES:
+        with subtests.test(command_line=command_line):
+            backend_test_no_install(new_npm_project, command_line, test_target)
 
 
-@pytest.mark.parametrize("command_line, test_target", PREVENT_INSTALL_TEST_CASES)
 def test_options_prevent_install_dependency_previous(
     npm_project_dependency_previous,
-    command_line: list[str],
-    test_target: str,
+    subtests: pytest.Subtests,
 ):
     """
     Test that the `-h`/`--help` and `--dry-run` options prevent an `npm install`
     command from running in an npm project with `TEST_PACKAGE@TEST_PACKAGE_PREVIOUS`
     specified as a dependency but not installed.
     """
-    backend_test_no_install(npm_project_dependency_previous, command_line, test_target)
+    for command_line, test_target in PREVENT_INSTALL_TEST_CASES:
+        with subtests.test(command_line=command_line):
+            backend_test_no_install(npm_project_dependency_previous, command_line, test_target)
 
 
-@pytest.mark.parametrize("command_line, test_target", PREVENT_INSTALL_TEST_CASES)
 def test_options_prevent_install_dependency_previous_lockfile(
     npm_project_dependency_previous_lockfile,
-    command_line: list[str],
-    test_target: str,
+    subtests: pytest.Subtests,
 ):
     """
     Test that the `-h`/`--help` and `--dry-run` options prevent an `npm install`
     command from running in an npm project with `TEST_PACKAGE@TEST_PACKAGE_PREVIOUS`
     specified as a dependency and present in the lockfile but not installed.
     """
-    backend_test_no_install(npm_project_dependency_previous_lockfile, command_line, test_target)
+    for command_line, test_target in PREVENT_INSTALL_TEST_CASES:
+        with subtests.test(command_line=command_line):
+            backend_test_no_install(npm_project_dependency_previous_lockfile, command_line, test_target)
 
 
-@pytest.mark.parametrize("command_line, test_target", PREVENT_INSTALL_TEST_CASES)
 def test_options_prevent_install_installed_previous(
     npm_project_installed_previous,
-    command_line: list[str],
-    test_target: str,
+    subtests: pytest.Subtests,
 ):
     """
     Test that the `-h`/`--help` and `--dry-run` options prevent an `npm install` command
     from running in an npm project with `TEST_PACKAGE@TEST_PACKAGE_PREVIOUS` installed.
     """
-    backend_test_no_install(
-        npm_project_installed_previous,
-        command_line,
-        test_target,
-    )
+    for command_line, test_target in PREVENT_INSTALL_TEST_CASES:
+        with subtests.test(command_line=command_line):
+            backend_test_no_install(npm_project_installed_previous, command_line, test_target)
 
 
 def test_local_dependency_json_structure(
@@ -482,6 +490,7 @@ def test_npm_list_installed_remote_resolved(npm_project_installed_latest):
         text=True,
         capture_output=True,
         cwd=npm_project_installed_latest,
+        stdin=subprocess.DEVNULL,
     )
     dependencies = json.loads(npm_list_process.stdout.strip()).get("dependencies")
     assert dependencies and TEST_PACKAGE in dependencies
@@ -503,6 +512,7 @@ def test_npm_list_installed_local_dependency(npm_project_local_dependency_instal
         text=True,
         capture_output=True,
         cwd=npm_project_local_dependency_installed,
+        stdin=subprocess.DEVNULL,
     )
     dependencies = json.loads(npm_list_process.stdout.strip()).get("dependencies")
     assert dependencies and LOCAL_PACKAGE_NAME in dependencies
@@ -529,6 +539,7 @@ def test_npm_lockfile_resolved_field_remote(npm_project_dependency_latest):
         text=True,
         capture_output=True,
         cwd=npm_project_dependency_latest,
+        stdin=subprocess.DEVNULL,
     )
 
     with open(npm_project_dependency_latest / "package-lock.json") as f:
@@ -553,6 +564,7 @@ def backend_test_npm_install_package_lock_only(project: Path, command_line: list
         text=True,
         capture_output=True,
         cwd=project,
+        stdin=subprocess.DEVNULL,
     )
 
     package_json_path = project / "package.json"
@@ -600,7 +612,7 @@ def backend_test_no_install(
     if (has_node_modules := node_modules_path.is_dir()):
         check_node_modules(node_modules_path, package_name, version)
 
-    subprocess.run(command_line, check=True, cwd=project)
+    subprocess.run(command_line, check=True, cwd=project, stdin=subprocess.DEVNULL)
 
     if has_lockfile:
         check_lockfile(lockfile_path, package_name, version)
@@ -654,7 +666,7 @@ def backend_test_npm_list(
 
     if should_fail:
         with pytest.raises(subprocess.CalledProcessError):
-            subprocess.run(npm_list_command, check=True, cwd=project)
+            subprocess.run(npm_list_command, check=True, cwd=project, stdin=subprocess.DEVNULL)
         return
 
     npm_list_process = subprocess.run(
@@ -662,7 +674,8 @@ def backend_test_npm_list(
         check=True,
         text=True,
         capture_output=True,
-        cwd=project
+        cwd=project,
+        stdin=subprocess.DEVNULL,
     )
     npm_list = json.loads(npm_list_process.stdout.strip())
 
@@ -690,6 +703,7 @@ def get_silly_log_lines(project: Path, command_line: list[str]) -> list[str]:
         text=True,
         capture_output=True,
         cwd=project,
+        stdin=subprocess.DEVNULL,
     )
 
     silly_lines = list(
@@ -3,10 +3,8 @@ Tests of pip's command line behavior.
 """
 
 import json
-import os
 from pathlib import Path
 import subprocess
-import sys
 import tempfile
 from typing import Optional
 
@@ -15,99 +13,64 @@ import pytest
 
 from .pip_fixtures import (
     LOCAL_PACKAGE_NAME,
+    PIP_COMMAND_PREFIX,
     REMOTE_PACKAGE_NAME,
     TEST_PACKAGE_NAME,
     TEST_PACKAGE_VERSION,
+    pip_list,
 )
 
-PIP_COMMAND_PREFIX = [sys.executable, "-m", "pip"]
-
-
-def pip_list() -> str:
-    """
-    Get the current state of packages installed via pip.
-    """
-    pip_list_command = PIP_COMMAND_PREFIX + ["list", "--format", "freeze"]
-    return subprocess.run(pip_list_command, check=True, text=True, capture_output=True).stdout.lower()
-
-
-def select_test_install_target(installed_packages: str) -> str:
-    """
-    Select a test target that is not in the given installed packages output.
-
-    This allows us to be certain when testing that nothing was installed in a dry-run.
-    """
-    def read_top_pypi_packages() -> set[str]:
-        test_dir = os.path.dirname(os.path.realpath(__file__, strict=True))
-        top_packages_file = os.path.join(test_dir, "top_pypi_packages.txt")
-        with open(top_packages_file) as f:
-            return set(f.read().split())
-
-    try:
-        top_packages = read_top_pypi_packages()
-        while (choice := top_packages.pop()) in installed_packages:
-            pass
-        return choice
-
-    except KeyError:
-        raise RuntimeError("Unable to select a target package for testing")
-
-
-INIT_PIP_STATE = pip_list()
-"""
-Caches the pip installation state before running any tests.
-"""
-
-TEST_TARGET = select_test_install_target(INIT_PIP_STATE)
-"""
-A fresh (not currently installed) package target to use for testing.
-"""
-
 
 def test_pip_version_output():
     """
     Test that `pip --version` has the required format.
     """
-    pip_version = subprocess.run(PIP_COMMAND_PREFIX + ["--version"], check=True, text=True, capture_output=True)
+    pip_version = subprocess.run(
+        PIP_COMMAND_PREFIX + ["--version"],
+        check=True,
+        text=True,
+        capture_output=True,
+        stdin=subprocess.DEVNULL,
+    )
     version_str = pip_version.stdout.split()[1]
     version.parse(version_str)
 
 
-@pytest.mark.parametrize(
-        "command_line",
-        [
-            PIP_COMMAND_PREFIX + ["-h", "install", TEST_TARGET],
-            PIP_COMMAND_PREFIX + ["--help", "install", TEST_TARGET],
-            PIP_COMMAND_PREFIX + ["install", "-h", TEST_TARGET],
-            PIP_COMMAND_PREFIX + ["install", "--help", TEST_TARGET],
-            PIP_COMMAND_PREFIX + ["install", "--dry-run", TEST_TARGET],
-            PIP_COMMAND_PREFIX + ["install", "--dry-run", TEST_TARGET, "--dry-run"]
-        ]
-)
-def test_pip_no_change(command_line: list[str]):
+def test_pip_no_change(subtests: pytest.Subtests, init_pip_state: frozenset[str], test_target: str):
     """
-    Backend function for testing that a `pip` command does not encounter any
-    errors and does not modify the local `pip` installation state.
+    Test that various `pip` commands do not encounter any errors and do not
+    modify the local `pip` installation state.
     """
-    subprocess.run(command_line, check=True)
-    assert pip_list() == INIT_PIP_STATE
+    command_lines = [
+        PIP_COMMAND_PREFIX + ["-h", "install", test_target],
+        PIP_COMMAND_PREFIX + ["--help", "install", test_target],
+        PIP_COMMAND_PREFIX + ["install", "-h", test_target],
+        PIP_COMMAND_PREFIX + ["install", "--help", test_target],
+        PIP_COMMAND_PREFIX + ["install", "--dry-run", test_target],
+        PIP_COMMAND_PREFIX + ["install", "--dry-run", test_target, "--dry-run"]
+    ]
 
+    for command_line in command_lines:
+        with subtests.test(command_line=command_line):
+            subprocess.run(command_line, check=True, stdin=subprocess.DEVNULL)
+            assert pip_list() == init_pip_state
 
-@pytest.mark.parametrize(
-        "command_line",
-        [
-            PIP_COMMAND_PREFIX + ["--dry-run", "install", TEST_TARGET],
-            PIP_COMMAND_PREFIX + ["install", "--dry-run", "!!!a_nonexistent_p@ckage_name"]
-        ]
-)
-def test_pip_no_change_error(command_line: list[str]):
+
+def test_pip_no_change_error(subtests: pytest.Subtests, init_pip_state: frozenset[str], test_target: str):
     """
-    Backend function for testing that a `pip` command raises an error and
-    does not modify the local `pip` installation state.
+    Test that various `pip` commands raise an error and do not modify the local
+    `pip` installation state.
     """
-    with pytest.raises(subprocess.CalledProcessError):
-        subprocess.run(command_line, check=True)
-    assert pip_list() == INIT_PIP_STATE
+    command_lines = [
+        PIP_COMMAND_PREFIX + ["--dry-run", "install", test_target],
+        PIP_COMMAND_PREFIX + ["install", "--dry-run", "!!!a_nonexistent_p@ckage_name"]
+    ]
+
+    for command_line in command_lines:
+        with subtests.test(command_line=command_line):
+            with pytest.raises(subprocess.CalledProcessError):
+                subprocess.run(command_line, check=True, stdin=subprocess.DEVNULL)
+            assert pip_list() == init_pip_state
 
 
 @pytest.mark.parametrize(
@@ -125,16 +88,16 @@ def test_pip_no_change_error(command_line: list[str]):
             (False, ["-vvvv", "-qqqqq"]),
         ]
 )
-def test_pip_install_report_verbose_json(should_fail: bool, verbose_options: list[str]):
+def test_pip_install_report_verbose_json(should_fail: bool, verbose_options: list[str], test_target: str):
     """
     Test to determine how many `-q/--quiet` options are needed to override various
     numbers of `-v/--verbose` options (no effect after three), measured by whether
     the report JSON parses successfully when read from stdout.
     """
     command_line = (
-        PIP_COMMAND_PREFIX + ["install", "--dry-run", "--report", "-", TEST_TARGET] + verbose_options
+        PIP_COMMAND_PREFIX + ["install", "--dry-run", "--report", "-", test_target] + verbose_options
     )
-    p = subprocess.run(command_line, check=True, text=True, capture_output=True)
+    p = subprocess.run(command_line, check=True, text=True, capture_output=True, stdin=subprocess.DEVNULL)
     if should_fail:
         with pytest.raises(json.JSONDecodeError):
             json.loads(p.stdout)
@@ -142,7 +105,7 @@ def test_pip_install_report_verbose_json(should_fail: bool, verbose_options: lis
         json.loads(p.stdout)
 
 
-def test_pip_install_report_override():
+def test_pip_install_report_override(test_target: str):
     """
     Test that all but the last instance of the `--report` option in the command
     line are ignored by `pip`.
@@ -150,9 +113,9 @@ def test_pip_install_report_override():
     with tempfile.NamedTemporaryFile() as tmpfile:
         command_line = (
             PIP_COMMAND_PREFIX +
-            ["--quiet", "install", "--dry-run", "--report", tmpfile.name, TEST_TARGET, "--report", "-"]
+            ["--quiet", "install", "--dry-run", "--report", tmpfile.name, test_target, "--report", "-"]
         )
-        p = subprocess.run(command_line, check=True, text=True, capture_output=True)
+        p = subprocess.run(command_line, check=True, text=True, capture_output=True, stdin=subprocess.DEVNULL)
         # The report went to stdout and has installation targets
         assert p.stdout
         report = json.loads(p.stdout)
@@ -201,7 +164,7 @@ def _test_pip_install_report_format(
         PIP_COMMAND_PREFIX +
         ["install", target_spec, "--dry-run", "-qqqqq", "--report", "-"]
     )
-    p = subprocess.run(command_line, check=True, text=True, capture_output=True)
+    p = subprocess.run(command_line, check=True, text=True, capture_output=True, stdin=subprocess.DEVNULL)
     install_reports = json.loads(p.stdout).get("install", [])
 
     assert len(install_reports) == 1
@@ -279,7 +242,7 @@ def test_pip_inspect_registry_package_no_direct_url(pip_project_remote_dependenc
     """
     venv_pip = pip_project_remote_dependency_installed / "venv" / "bin" / "pip"
 
-    result = subprocess.run([venv_pip, "inspect"], check=True, text=True, capture_output=True)
+    result = subprocess.run([venv_pip, "inspect"], check=True, text=True, capture_output=True, stdin=subprocess.DEVNULL)
     installed = json.loads(result.stdout).get("installed", [])
 
     matching = [
@@ -299,7 +262,7 @@ def test_pip_inspect_local_package_direct_url_format(pip_project_local_dependenc
     """
     venv_pip = pip_project_local_dependency_installed / "venv" / "bin" / "pip"
 
-    result = subprocess.run([venv_pip, "inspect"], check=True, text=True, capture_output=True)
+    result = subprocess.run([venv_pip, "inspect"], check=True, text=True, capture_output=True, stdin=subprocess.DEVNULL)
     installed = json.loads(result.stdout).get("installed", [])
 
     matching = [
@@ -323,7 +286,7 @@ def backend_test_pip_inspect_matches_pip_list(project_dir: Path):
     venv_pip = project_dir / "venv" / "bin" / "pip"
 
     pip_inspect = subprocess.run(
-        [venv_pip, "inspect"], check=True, text=True, capture_output=True
+        [venv_pip, "inspect"], check=True, text=True, capture_output=True, stdin=subprocess.DEVNULL
     )
     inspect_packages = {
         (e["metadata"]["name"], e["metadata"]["version"])
@@ -331,7 +294,7 @@ def backend_test_pip_inspect_matches_pip_list(project_dir: Path):
     }
 
     pip_list = subprocess.run(
-        [venv_pip, "list", "--format", "json"], check=True, text=True, capture_output=True
+        [venv_pip, "list", "--format", "json"], check=True, text=True, capture_output=True, stdin=subprocess.DEVNULL
     )
 
     # pip v22.2 prints non-JSON to stdout...
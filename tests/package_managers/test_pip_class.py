@@ -16,8 +16,8 @@ from scfw.package_managers.pip import Pip
 from .pip_fixtures import (
     TEST_PACKAGE_NAME,
     TEST_PACKAGE_VERSION,
+    pip_list,
 )
-from .test_pip import INIT_PIP_STATE, TEST_TARGET, pip_list
 
 PACKAGE_MANAGER = Pip()
 """
@@ -37,37 +37,45 @@ def test_executable():
 @pytest.mark.parametrize(
         "command_line,has_targets",
         [
-            (["pip", "install", TEST_TARGET], True),
-            (["pip", "-h", "install", TEST_TARGET], False),
-            (["pip", "--help", "install", TEST_TARGET], False),
-            (["pip", "install", "-h", TEST_TARGET], False),
-            (["pip", "install", "--help", TEST_TARGET], False),
-            (["pip", "install" "--dry-run", TEST_TARGET], False),
-            (["pip", "--dry-run", "install", TEST_TARGET], False),
-            (["pip", "install", "--report", "report.json", TEST_TARGET], True),
-            (["pip", "install", "--non-existent-option", TEST_TARGET], False),
-            (["pip", "install", "-v", TEST_TARGET], True),
-            (["pip", "install", "-vv", TEST_TARGET], True),
-            (["pip", "install", "-vvv", TEST_TARGET], True),
-            (["pip", "install", "-vvvv", TEST_TARGET], True),
-            (["pip", "install", "--verbose", TEST_TARGET], True),
-            (["pip", "install", "--verbose", "--verbose", TEST_TARGET], True),
-            (["pip", "install", "--verbose", "--verbose", "--verbose", TEST_TARGET], True),
-            (["pip", "install", "--verbose", "--verbose", "--verbose", "--verbose", TEST_TARGET], True),
-        ]
+            (["pip", "install"], True),
+            (["pip", "-h", "install"], False),
+            (["pip", "--help", "install"], False),
+            (["pip", "install", "-h"], False),
+            (["pip", "install", "--help"], False),
+            (["pip", "install", "--dry-run"], False),
+            (["pip", "--dry-run", "install"], False),
+            (["pip", "install", "--report", "report.json"], True),
+            (["pip", "install", "--non-existent-option"], False),
+            (["pip", "install", "-v"], True),
+            (["pip", "install", "-vv"], True),
+            (["pip", "install", "-vvv"], True),
+            (["pip", "install", "-vvvv"], True),
+            (["pip", "install", "--verbose"], True),
+            (["pip", "install", "--verbose", "--verbose"], True),
+            (["pip", "install", "--verbose", "--verbose", "--verbose"], True),
+            (["pip", "install", "--verbose", "--verbose", "--verbose", "--verbose"], True),
+        ],
+        ids=lambda value: " ".join(value) if isinstance(value, list) else None,
 )
-def test_pip_command_resolve_install_targets(command_line: list[str], has_targets: bool):
+def test_pip_command_resolve_install_targets(
+    command_line: list[str],
+    has_targets: bool,
+    init_pip_state: frozenset[str],
+    test_target: str,
+):
     """
     Backend function for testing that a `Pip.resolve_install_targets` call
     either does or does not have install targets and does not modify the
     local pip installation state.
+
+    The test target is appended to each of the parametrized command lines.
     """
-    targets = PACKAGE_MANAGER.resolve_install_targets(command_line)
+    targets = PACKAGE_MANAGER.resolve_install_targets(command_line + [test_target])
     if has_targets:
         assert targets
     else:
         assert not targets
-    assert pip_list() == INIT_PIP_STATE
+    assert pip_list() == init_pip_state
 
 
 def test_pip_command_resolve_install_targets_exact():
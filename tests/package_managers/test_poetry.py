@@ -14,6 +14,7 @@ from .poetry_fixtures import (
     TARGET_LATEST,
     TARGET_PREVIOUS,
     TEST_PROJECT_NAME,
+    poetry_show,
 )
 
 POETRY_V2 = version.parse("2.0.0")
@@ -26,7 +27,7 @@ def test_poetry_version_output():
     assert poetry_version() is not None
 
 
-def test_poetry_add_no_change(new_poetry_project):
+def test_poetry_add_no_change(shared_poetry_project):
     """
     Test that certain `poetry add` commands relied on by Supply Chain Firewall not
     to error or modify the local installation state indeed have these properties.
@@ -49,12 +50,12 @@ def test_poetry_add_no_change(new_poetry_project):
         ["poetry", "add", TARGET, "--dry-run"],
     ]
 
-    init_state = poetry_show(new_poetry_project)
+    project, init_state = shared_poetry_project
 
-    assert all(_test_poetry_no_change(new_poetry_project, init_state, command) for command in test_cases)
+    assert all(_test_poetry_no_change(project, init_state, command) for command in test_cases)
 
 
-def test_poetry_install_no_change(new_poetry_project):
+def test_poetry_install_no_change(shared_poetry_project):
     """
     Test that certain `poetry install` commands relied on by Supply Chain Firewall
     not to error or modify the local installation state indeed have these properties.
@@ -72,12 +73,12 @@ def test_poetry_install_no_change(new_poetry_project):
         ["poetry", "install", "--dry-run"],
     ]
 
-    init_state = poetry_show(new_poetry_project)
+    project, init_state = shared_poetry_project
 
-    assert all(_test_poetry_no_change(new_poetry_project, init_state, command) for command in test_cases)
+    assert all(_test_poetry_no_change(project, init_state, command) for command in test_cases)
 
 
-def test_poetry_sync_no_change(new_poetry_project):
+def test_poetry_sync_no_change(shared_poetry_project):
     """
     Test that certain `poetry sync` commands relied on by Supply Chain Firewall
     not to error or modify the local installation state indeed have these properties.
@@ -101,12 +102,12 @@ def test_poetry_sync_no_change(new_poetry_project):
         ["poetry", "sync", "--dry-run"],
     ]
 
-    init_state = poetry_show(new_poetry_project)
+    project, init_state = shared_poetry_project
 
-    assert all(_test_poetry_no_change(new_poetry_project, init_state, command) for command in test_cases)
+    assert all(_test_poetry_no_change(project, init_state, command) for command in test_cases)
 
 
-def test_poetry_update_no_change(new_poetry_project):
+def test_poetry_update_no_change(shared_poetry_project):
     """
     Test that certain `poetry update` commands relied on by Supply Chain Firewall
     not to error or modify the local installation state indeed have these properties.
@@ -124,9 +125,9 @@ def test_poetry_update_no_change(new_poetry_project):
         ["poetry", "update", "--dry-run"],
     ]
 
-    init_state = poetry_show(new_poetry_project)
+    project, init_state = shared_poetry_project
 
-    assert all(_test_poetry_no_change(new_poetry_project, init_state, command) for command in test_cases)
+    assert all(_test_poetry_no_change(project, init_state, command) for command in test_cases)
 
 
 def _test_poetry_no_change(project, init_state, command) -> bool:
@@ -138,7 +139,7 @@ def _test_poetry_no_change(project, init_state, command) -> bool:
     return poetry_show(project) == init_state
 
 
-def test_poetry_add_error_no_change(new_poetry_project):
+def test_poetry_add_error_no_change(shared_poetry_project):
     """
     Tests that certain `poetry add` commands encounter an error and do not modify
     the local installation state when run in the context of a given project.
@@ -161,12 +162,12 @@ def test_poetry_add_error_no_change(new_poetry_project):
         ["poetry", "add", "--directory", TARGET],
     ]
 
-    init_state = poetry_show(new_poetry_project)
+    project, init_state = shared_poetry_project
 
-    assert all(_test_poetry_error_no_change(new_poetry_project, init_state, command) for command in test_cases)
+    assert all(_test_poetry_error_no_change(project, init_state, command) for command in test_cases)
 
 
-def test_poetry_install_error_no_change(new_poetry_project):
+def test_poetry_install_error_no_change(shared_poetry_project):
     """
     Tests that certain `poetry install` commands encounter an error and do not
     modify the local installation state when run in the context of a given project.
@@ -186,12 +187,12 @@ def test_poetry_install_error_no_change(new_poetry_project):
         ["poetry", "install", "--directory"],
     ]
 
-    init_state = poetry_show(new_poetry_project)
+    project, init_state = shared_poetry_project
 
-    assert all(_test_poetry_error_no_change(new_poetry_project, init_state, command) for command in test_cases)
+    assert all(_test_poetry_error_no_change(project, init_state, command) for command in test_cases)
 
 
-def test_poetry_sync_error_no_change(new_poetry_project):
+def test_poetry_sync_error_no_change(shared_poetry_project):
     """
     Tests that certain `poetry sync` commands encounter an error and do not
     modify the local installation state when run in the context of a given project.
@@ -217,12 +218,12 @@ def test_poetry_sync_error_no_change(new_poetry_project):
         ["poetry", "sync", "--directory"],
     ]
 
-    init_state = poetry_show(new_poetry_project)
+    project, init_state = shared_poetry_project
 
-    assert all(_test_poetry_error_no_change(new_poetry_project, init_state, command) for command in test_cases)
+    assert all(_test_poetry_error_no_change(project, init_state, command) for command in test_cases)
 
 
-def test_poetry_update_error_no_change(new_poetry_project):
+def test_poetry_update_error_no_change(shared_poetry_project):
     """
     Tests that certain `poetry update` commands encounter an error and do not
     modify the local installation state when run in the context of a given project.
@@ -246,9 +247,9 @@ def test_poetry_update_error_no_change(new_poetry_project):
         ["poetry", "update", TARGET, "--directory"],
     ]
 
-    init_state = poetry_show(new_poetry_project)
+    project, init_state = shared_poetry_project
 
-    assert all(_test_poetry_error_no_change(new_poetry_project, init_state, command) for command in test_cases)
+    assert all(_test_poetry_error_no_change(project, init_state, command) for command in test_cases)
 
 
 def _test_poetry_error_no_change(project, init_state, command) -> bool:
@@ -339,14 +340,6 @@ def test_poetry_dry_run_output_downgrade(
         assert any(is_downgrade_line(TARGET, line) for line in dry_run.stdout.split('\n'))
 
 
-def poetry_show(project_dir: str) -> str:
-    """
-    Get the current state of packages installed via Poetry.
-    """
-    poetry_show = subprocess.run(["poetry", "show"], check=True, cwd=project_dir, text=True, capture_output=True)
-    return poetry_show.stdout.lower()
-
-
 def poetry_version() -> Optional[version.Version]:
     """
     Get the version number of the active Poetry executable if it has the required
@@ -11,8 +11,9 @@ from .poetry_fixtures import (
     TARGET_LATEST,
     TARGET_PREVIOUS,
     TEST_PROJECT_NAME,
+    poetry_show,
 )
-from .test_poetry import POETRY_V2, poetry_show, poetry_version
+from .test_poetry import POETRY_V2, poetry_version
 
 PACKAGE_MANAGER = Poetry()
 """
@@ -0,0 +1,100 @@
+"""
+Tests of `PackageCache`.
+"""
+
+from pathlib import Path
+import pytest
+from tempfile import TemporaryDirectory
+import time
+from typing import Callable
+
+from scfw.cache import PackageCache
+from scfw.ecosystem import ECOSYSTEM
+from scfw.package import Package
+
+TTL = 60
+"""
+The fixed TTL to use in tests.
+"""
+
+
+def ttl_by_value(value: str) -> int:
+    """
+    A value-dependent TTL to use in tests: values beginning with `"MAL"` are cached for longer.
+    """
+    return 10 * TTL if value.startswith("MAL") else TTL
+
+
+@pytest.mark.parametrize(
+        "values",
+        [
+            [1704112200.0, 1751241601.5],
+            ["GHSA-xxxx-xxxx-xxxx MAL-2024-1", ""],
+        ]
+)
+def test_package_cache_round_trip(values: list):
+    """
+    Test that `PackageCache` returns previously cached values, including empty
+    ones, and omits packages that have not been cached.
+    """
+    packages = [Package(ECOSYSTEM.PyPI, f"foo{i}", "1.0") for i in range(len(values) + 1)]
+    cached = dict(zip(packages, values))
+
+    with TemporaryDirectory() as tmp:
+        cache = PackageCache(Path(tmp) / "cache.db", "test_cache", TTL)
+        cache.put(cached)
+
+        assert PackageCache(Path(tmp) / "cache.db", "test_cache", TTL).get(packages) == cached
+
+
+def test_package_cache_tables():
+    """
+    Test that `PackageCache` instances backed by different tables of the same
+    database file do not share entries.
+    """
+    package = Package(ECOSYSTEM.Npm, "foo", "1.0.0")
+
+    with TemporaryDirectory() as tmp:
+        cache = PackageCache(Path(tmp) / "cache.db", "test_cache", TTL)
+        cache.put({package: "foo"})
+
+        assert PackageCache(Path(tmp) / "cache.db", "other_cache", TTL).get([package]) == {}
+
+
+def test_package_cache_invalid_table():
+    """
+    Test that `PackageCache` rejects table names that are not valid identifiers.
+    """
+    with TemporaryDirectory() as tmp:
+        with pytest.raises(ValueError):
+            PackageCache(Path(tmp) / "cache.db", "test_cache; DROP TABLE test_cache", TTL)
+
+
+@pytest.mark.parametrize(
+        "ttl,value,expected_ttl",
+        [
+            (TTL, 1704067200.0, TTL),
+            (TTL, "GHSA-xxxx-xxxx-xxxx", TTL),
+            (ttl_by_value, "MAL-2024-1", 10 * TTL),
+            (ttl_by_value, "GHSA-xxxx-xxxx-xxxx", TTL),
+            (ttl_by_value, "", TTL),
+        ]
+)
+def test_package_cache_expiry(monkeypatch, ttl: int | Callable, value, expected_ttl: int):
+    """
+    Test that `PackageCache` entries expire after the TTL appropriate to their values.
+    """
+    package = Package(ECOSYSTEM.Npm, "foo", "1.0.0")
+    now = time.time()
+
+    with TemporaryDirectory() as tmp:
+        cache = PackageCache(Path(tmp) / "cache.db", "test_cache", ttl)
+
+        monkeypatch.setattr(time, "time", lambda: now)
+        cache.put({package: value})
+
+        monkeypatch.setattr(time, "time", lambda: now + expected_ttl - 1)
+        assert cache.get([package]) == {package: value}
+
+        monkeypatch.setattr(time, "time", lambda: now + expected_ttl)
+        assert cache.get([package]) == {}
@@ -0,0 +1,28 @@
+"""
+Tests of `Package`.
+"""
+
+from dataclasses import asdict
+import pickle
+
+from scfw.ecosystem import ECOSYSTEM
+from scfw.package import Package, RemotePackageSource
+
+
+def test_package_asdict():
+    """
+    Test that the cached hash of a `Package` is not exposed as one of its fields.
+    """
+    package = Package(ECOSYSTEM.PyPI, "foo", "1.0")
+
+    assert asdict(package) == {"ecosystem": ECOSYSTEM.PyPI, "name": "foo", "version": "1.0", "source": None}
+
+
+def test_package_hash_pickle():
+    """
+    Test that a `Package` is equal to and hashes the same as its unpickled copy.
+    """
+    package = Package(ECOSYSTEM.Npm, "foo", "1.0.0", RemotePackageSource("https://example.com/foo-1.0.0.tgz"))
+    copy = pickle.loads(pickle.dumps(package))
+
+    assert copy == package and hash(copy) == hash(package)
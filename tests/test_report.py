@@ -297,3 +297,25 @@ def test_get_unverifiable_returns_copy():
     report.insert_unverifiable(_PKG_B, _ERROR_MESSAGE)
     report.get_unverifiable()[_PKG_B].add(VerifierErrorMessage("other", "extra"))
     assert len(report.get_unverifiable()[_PKG_B]) == 1
+
+
+def test_get_findings_by_severity():
+    """
+    `get_findings_by_severity()` agrees with `get_findings()` for every severity.
+    """
+    report = VerificationReport()
+    report.insert_finding(_PKG_A, _CRITICAL_FINDING)
+    report.insert_finding(_PKG_A, _WARNING_FINDING)
+    report.insert_finding(_PKG_B, _WARNING_FINDING)
+    report.insert_unverifiable(_PKG_C, _ERROR_MESSAGE)
+
+    assert report.get_findings_by_severity() == {
+        severity: report.get_findings(severity) for severity in FindingSeverity
+    }
+
+
+def test_empty_report_get_findings_by_severity():
+    """
+    An empty report has an empty findings report for every severity.
+    """
+    assert VerificationReport().get_findings_by_severity() == {severity: {} for severity in FindingSeverity}
@@ -6,10 +6,11 @@ from datetime import timedelta
 
 import pytest
 
+from scfw.constants import SCFW_HOME_VAR
 from scfw.ecosystem import ECOSYSTEM
 from scfw.package import Package
 from scfw.verifier import FindingSeverity, UnverifiablePackage
-from scfw.verifiers.age_verifier import PackageAgeVerifier
+from scfw.verifiers.age_verifier import MINIMUM_AGE_DEFAULT, MINIMUM_AGE_VAR, PackageAgeVerifier
 
 from .. import utils
 
@@ -62,3 +63,43 @@ def test_no_warn_on_non_recent_package(test_package: Package, unverifiable: bool
         return
 
     assert not recency_verifier.verify(test_package)
+
+
+def test_verify_batch():
+    """
+    Test that `PackageAgeVerifier.verify_batch()` agrees with `verify()` on each package.
+    """
+    recency_verifier = PackageAgeVerifier()
+    recency_verifier.minimum_age = timedelta(days=365*1000000)
+
+    results = recency_verifier.verify_batch([test_package for test_package, _ in TEST_CASES])
+
+    for test_package, unverifiable in TEST_CASES:
+        if unverifiable:
+            assert isinstance(results[test_package], UnverifiablePackage)
+        else:
+            assert results[test_package] == recency_verifier.verify(test_package)
+
+
+@pytest.mark.parametrize(
+        "value,expected_hours",
+        [
+            ("12", 12),
+            (" 12", 12),
+            ("12\n", 12),
+            ("+12", 12),
+            ("0", 0),
+            ("-12", MINIMUM_AGE_DEFAULT),
+            ("1.5", MINIMUM_AGE_DEFAULT),
+            ("twelve", MINIMUM_AGE_DEFAULT),
+        ]
+)
+def test_minimum_age_env_var(monkeypatch, value: str, expected_hours: int):
+    """
+    Test that `PackageAgeVerifier` reads its minimum age from the environment,
+    falling back to the default for values that are not non-negative integers.
+    """
+    monkeypatch.delenv(SCFW_HOME_VAR, raising=False)
+    monkeypatch.setenv(MINIMUM_AGE_VAR, value)
+
+    assert PackageAgeVerifier().minimum_age == timedelta(hours=expected_hours)
@@ -2,13 +2,18 @@
 Tests of `OsvVerifier`.
 """
 
+import concurrent.futures as cf
+import json
 import pytest
 from typing import Callable
+from unittest.mock import MagicMock
 
+from scfw.constants import SCFW_HOME_VAR
 from scfw.ecosystem import ECOSYSTEM
 from scfw.package import Package
 from scfw.verifier import FindingSeverity, UnverifiablePackage
-from scfw.verifiers.osv_verifier import OsvVerifier
+import scfw.verifiers.osv_verifier as osv_verifier_module
+from scfw.verifiers.osv_verifier import OSV_CONCURRENCY_DEFAULT, OSV_CONCURRENCY_VAR, OsvVerifier
 
 from .. import utils
 
@@ -276,3 +281,181 @@ def test_osv_verifier_malicious(
             assert any_warning
         else:
             assert not any_warning
+
+
+@pytest.mark.parametrize("ecosystem", [ECOSYSTEM.Npm, ECOSYSTEM.PyPI])
+def test_osv_verifier_verify_batch(ecosystem: ECOSYSTEM):
+    """
+    Test that `OsvVerifier.verify_batch` agrees with the expected per-package
+    results across a mixed batch of verifiable and unverifiable packages.
+    """
+    osv_verifier = OsvVerifier()
+
+    match ecosystem:
+        case ECOSYSTEM.Npm:
+            test_set = NPM_TEST_SET
+        case ECOSYSTEM.PyPI:
+            test_set = PYPI_TEST_SET
+
+    test_cases = {
+        utils.build_registry_package(ecosystem, name, version): (has_critical, has_warning)
+        for name, version, has_critical, has_warning in test_set
+    }
+    unverifiable = utils.build_local_package(ecosystem, *test_set[0][:2])
+
+    results = osv_verifier.verify_batch([*test_cases, unverifiable])
+    assert set(results) == set(test_cases) | {unverifiable}
+    assert isinstance(results[unverifiable], UnverifiablePackage)
+
+    for package, (has_critical, has_warning) in test_cases.items():
+        findings = results[package]
+        assert isinstance(findings, set) and findings
+
+        assert has_critical == any(finding.severity == FindingSeverity.CRITICAL for finding in findings)
+        assert has_warning == any(finding.severity == FindingSeverity.WARNING for finding in findings)
+
+
+def test_osv_query_batch_chunk_failure(monkeypatch):
+    """
+    Test that a batch query rejected because of one bad query only causes the
+    verification of that query's package to fail.
+    """
+    packages = [Package(ECOSYSTEM.PyPI, f"foo{i}", "1.0") for i in range(5)]
+    bad_package = packages[2]
+
+    def post(url, **kwargs):
+        queries = kwargs["json"]["queries"]
+
+        response = MagicMock()
+        if any(query["package"]["name"] == bad_package.name for query in queries):
+            response.status_code = 400
+            return response
+
+        response.status_code = 200
+        response.content = json.dumps(
+            {"results": [{"vulns": [{"id": f"GHSA-{query['package']['name']}"}]} for query in queries]}
+        ).encode()
+        return response
+
+    monkeypatch.setattr(osv_verifier_module._session, "post", post)
+    monkeypatch.setattr(osv_verifier_module, "_OSV_DEV_QUERY_BATCH_SIZE", len(packages))
+
+    with cf.ThreadPoolExecutor() as executor:
+        osv_ids, failed = osv_verifier_module._query_batch(executor, packages)
+
+    assert failed == {bad_package}
+    assert osv_ids == {package: {f"GHSA-{package.name}"} for package in packages if package != bad_package}
+
+
+def test_osv_query_batch_transport_failure(monkeypatch):
+    """
+    Test that a batch query that fails for reasons unrelated to its queries fails
+    the verification of all its packages without being resent in smaller chunks.
+    """
+    packages = [Package(ECOSYSTEM.PyPI, f"foo{i}", "1.0") for i in range(5)]
+    requests_made = []
+
+    def post(url, **kwargs):
+        requests_made.append(kwargs["json"]["queries"])
+        raise ConnectionError("Connection refused")
+
+    monkeypatch.setattr(osv_verifier_module._session, "post", post)
+    monkeypatch.setattr(osv_verifier_module, "_OSV_DEV_QUERY_BATCH_SIZE", len(packages))
+
+    with cf.ThreadPoolExecutor() as executor:
+        osv_ids, failed = osv_verifier_module._query_batch(executor, packages)
+
+    assert len(requests_made) == 1
+    assert failed == set(packages) and not osv_ids
+
+
+def test_osv_query_batch_page_failure(monkeypatch):
+    """
+    Test that a failed request for a package's next page of results only causes
+    the verification of that package to fail.
+    """
+    packages = [Package(ECOSYSTEM.PyPI, f"foo{i}", "1.0") for i in range(3)]
+    bad_package = packages[1]
+
+    def post(url, **kwargs):
+        queries = kwargs["json"]["queries"]
+        if any(query.get("page_token") and query["package"]["name"] == bad_package.name for query in queries):
+            raise RuntimeError("Bad page")
+
+        results = []
+        for query in queries:
+            name, page_token = query["package"]["name"], query.get("page_token")
+            result = {"vulns": [{"id": f"GHSA-{name}-{page_token or 0}"}]}
+            if not page_token:
+                result["next_page_token"] = "1"
+            results.append(result)
+
+        response = MagicMock()
+        response.content = json.dumps({"results": results}).encode()
+        return response
+
+    monkeypatch.setattr(osv_verifier_module._session, "post", post)
+
+    with cf.ThreadPoolExecutor() as executor:
+        osv_ids, failed = osv_verifier_module._query_batch(executor, packages)
+
+    assert failed == {bad_package}
+    assert osv_ids == {
+        package: {f"GHSA-{package.name}-0", f"GHSA-{package.name}-1"} for package in packages if package != bad_package
+    }
+
+
+@pytest.mark.parametrize(
+        "content",
+        [
+            b"<html><body>Please log in to continue</body></html>",
+            b"",
+            b'{"error":"quota"}',
+            b'{"results":[]}',
+            b'{"results":[{}, 1]}',
+        ]
+)
+def test_osv_verifier_malformed_response(monkeypatch, content: bytes):
+    """
+    Test that `OsvVerifier` treats packages whose batch query returns a successful
+    response that is not a well-formed OSV.dev batch result as failed rather than clean.
+    """
+    monkeypatch.delenv(SCFW_HOME_VAR, raising=False)
+
+    packages = [utils.build_registry_package(ECOSYSTEM.PyPI, f"foo{i}", "1.0") for i in range(2)]
+
+    def post(url, **kwargs):
+        response = MagicMock()
+        response.content = content
+        return response
+
+    monkeypatch.setattr(osv_verifier_module._session, "post", post)
+
+    results = OsvVerifier().verify_batch(packages)
+
+    for package in packages:
+        findings = results[package]
+        assert isinstance(findings, set) and len(findings) == 1
+        finding = findings.pop()
+        assert finding.severity == FindingSeverity.WARNING and finding.finding.startswith("Failed to verify")
+
+
+@pytest.mark.parametrize(
+        "value,expected",
+        [
+            ("4", 4),
+            ("16", 16),
+            ("64", 16),
+            ("0", OSV_CONCURRENCY_DEFAULT),
+            ("many", OSV_CONCURRENCY_DEFAULT),
+        ]
+)
+def test_osv_verifier_concurrency(monkeypatch, value: str, expected: int):
+    """
+    Test that `OsvVerifier` reads its request concurrency from the environment and
+    caps it at the size of its connection pool.
+    """
+    monkeypatch.delenv(SCFW_HOME_VAR, raising=False)
+    monkeypatch.setenv(OSV_CONCURRENCY_VAR, value)
+
+    assert OsvVerifier().concurrency == expected